@@ -11,9 +11,11 @@ Commands:
 
 import discord
 from discord import app_commands
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord.ui import View, Button, Select
 from typing import Optional, Literal, List
+from collections import defaultdict, deque
+from urllib.parse import unquote
 import random
 import asyncio
 import aiohttp
@@ -21,6 +23,84 @@ import aiohttp
 from utils.logger import logger
 
 
+# ============================================
+# GAME CONSTANTS
+# ============================================
+
+# Map categories to Open Trivia DB IDs
+TRIVIA_CATEGORY_IDS = {
+    "General Knowledge": 9,
+    "Science": 17,
+    "History": 23,
+    "Geography": 22,
+    "Entertainment": 11,
+    "Sports": 21,
+    "Art": 25,
+    "Animals": 27,
+    "Vehicles": 28,
+    "Computers": 18
+}
+
+# How many questions to fetch from Open Trivia DB per request
+TRIVIA_BATCH_SIZE = 20
+
+# Open Trivia DB allows one request per 5 seconds per IP
+TRIVIA_REQUEST_INTERVAL = 5
+
+# Open Trivia DB response codes
+TRIVIA_OK = 0
+TRIVIA_NO_RESULTS = 1  # Not enough questions for the requested amount
+TRIVIA_RATE_LIMITED = 5  # Too many requests
+
+# Pools with fewer questions than this get topped up in the background
+TRIVIA_PREFETCH_THRESHOLD = 5
+
+# Pool of pre-fetched questions per (category, difficulty)
+# so most /trivia calls are served without hitting the API
+_trivia_cache = defaultdict(lambda: deque(maxlen=50))
+
+# Batch size per (category, difficulty) - small pools can't fill a full batch
+_trivia_batch_sizes = defaultdict(lambda: TRIVIA_BATCH_SIZE)
+
+
+# Magic 8-ball answers
+EIGHTBALL_RESPONSES = (
+    # Positive
+    "It is certain.", "It is decidedly so.", "Without a doubt.",
+    "Yes, definitely.", "You may rely on it.", "As I see it, yes.",
+    "Most likely.", "Outlook good.", "Yes.", "Signs point to yes.",
+    # Neutral
+    "Reply hazy, try again.", "Ask again later.",
+    "Better not tell you now.", "Cannot predict now.",
+    "Concentrate and ask again.",
+    # Negative
+    "Don't count on it.", "My reply is no.", "My sources say no.",
+    "Outlook not so good.", "Very doubtful."
+)
+
+COIN_SIDES = ("Heads", "Tails")
+
+# Shared random generator for board generation
+_rng = random.Random()
+
+# Spoiler-wrapped minesweeper tiles (-1 = mine, 0-8 = neighbouring mines)
+MINESWEEPER_TILES = {
+    value: f"||{emoji}||"
+    for value, emoji in {
+        -1: "💥",
+        0: "⬜",
+        1: "1️⃣",
+        2: "2️⃣",
+        3: "3️⃣",
+        4: "4️⃣",
+        5: "5️⃣",
+        6: "6️⃣",
+        7: "7️⃣",
+        8: "8️⃣"
+    }.items()
+}
+
+
 # ============================================
 # TRIVIA GAME
 # ============================================
@@ -31,7 +111,8 @@ class TriviaView(View):
     def __init__(self, correct_answer: str, all_answers: List[str], timeout_seconds: int = 30):
         super().__init__(timeout=timeout_seconds)
         self.correct_answer = correct_answer
-        self.answered_users = {}  # user_id -> is_correct
+        self.answered_users = set()  # user_ids that already answered
+        self.correct_count = 0
         self.message = None
 
         # Create buttons for each answer
@@ -54,10 +135,10 @@ class TriviaView(View):
                 )
                 return
 
-            is_correct = answer == self.correct_answer
-            self.answered_users[interaction.user.id] = is_correct
+            self.answered_users.add(interaction.user.id)
 
-            if is_correct:
+            if answer == self.correct_answer:
+                self.correct_count += 1
                 await interaction.response.send_message(
                     "✅ Correct!",
                     ephemeral=True
@@ -82,10 +163,9 @@ class TriviaView(View):
 
             embed = self.message.embeds[0] if self.message.embeds else None
             if embed:
-                correct_count = sum(1 for v in self.answered_users.values() if v)
                 embed.add_field(
                     name="Results",
-                    value=f"✅ {correct_count} correct | ❌ {len(self.answered_users) - correct_count} wrong",
+                    value=f"✅ {self.correct_count} correct | ❌ {len(self.answered_users) - self.correct_count} wrong",
                     inline=False
                 )
                 embed.color = discord.Color.orange()
@@ -103,6 +183,10 @@ class TriviaView(View):
 class Connect4Game:
     """Connect 4 game logic"""
 
+    # Emoji for each cell value (empty, player 1, player 2)
+    EMOJIS = ("⚫", "🔴", "🟡")
+    COLUMN_LABELS = "1️⃣ 2️⃣ 3️⃣ 4️⃣ 5️⃣ 6️⃣ 7️⃣"
+
     def __init__(self, player1: discord.Member, player2: discord.Member):
         self.board = [[0 for _ in range(7)] for _ in range(6)]  # 6 rows, 7 columns
         self.player1 = player1
@@ -165,13 +249,9 @@ class Connect4Game:
 
     def render_board(self) -> str:
         """Render the board as a string"""
-        emojis = {0: "⚫", 1: "🔴", 2: "🟡"}
-        lines = []
-
-        for row in self.board:
-            lines.append(" ".join(emojis[cell] for cell in row))
-
-        lines.append("1️⃣ 2️⃣ 3️⃣ 4️⃣ 5️⃣ 6️⃣ 7️⃣")
+        emojis = self.EMOJIS
+        lines = [" ".join([emojis[cell] for cell in row]) for row in self.board]
+        lines.append(self.COLUMN_LABELS)
 
         return "\n".join(lines)
 
@@ -184,6 +264,15 @@ class Connect4View(View):
         self.game = game
         self.message = None
 
+        # Embed kept as a plain dict so each move only patches the changed keys
+        current = game.get_current_member()
+        self.embed_dict = {
+            "title": f"Connect 4 - {current.display_name}'s turn",
+            "description": game.render_board(),
+            "color": discord.Color.blue().value,
+            "footer": {"text": f"🔴 {current.display_name}"}
+        }
+
         # Add column buttons
         for i in range(7):
             button = Button(
@@ -218,28 +307,28 @@ class Connect4View(View):
                 return
 
             # Update the board
-            embed = interaction.message.embeds[0] if interaction.message.embeds else discord.Embed()
-            embed.description = self.game.render_board()
+            embed_dict = self.embed_dict
+            embed_dict["description"] = self.game.render_board()
 
             if self.game.game_over:
                 if self.game.winner:
                     winner = self.game.player1 if self.game.winner == 1 else self.game.player2
-                    embed.title = f"🎉 {winner.display_name} wins!"
-                    embed.color = discord.Color.gold()
+                    embed_dict["title"] = f"🎉 {winner.display_name} wins!"
+                    embed_dict["color"] = discord.Color.gold().value
                 else:
-                    embed.title = "🤝 It's a tie!"
-                    embed.color = discord.Color.orange()
+                    embed_dict["title"] = "🤝 It's a tie!"
+                    embed_dict["color"] = discord.Color.orange().value
 
                 # Disable all buttons
                 for item in self.children:
                     item.disabled = True
             else:
                 current = self.game.get_current_member()
-                embed.title = f"Connect 4 - {current.display_name}'s turn"
+                embed_dict["title"] = f"Connect 4 - {current.display_name}'s turn"
                 emoji = "🔴" if self.game.current_player == 1 else "🟡"
-                embed.set_footer(text=f"{emoji} {current.display_name}")
+                embed_dict["footer"] = {"text": f"{emoji} {current.display_name}"}
 
-            await interaction.response.edit_message(embed=embed, view=self)
+            await interaction.response.edit_message(embed=discord.Embed.from_dict(embed_dict), view=self)
 
         return callback
 
@@ -251,6 +340,13 @@ class Connect4View(View):
 class TicTacToeGame:
     """Tic Tac Toe game logic"""
 
+    # Winning combinations
+    WINS = (
+        (0, 1, 2), (3, 4, 5), (6, 7, 8),  # Rows
+        (0, 3, 6), (1, 4, 7), (2, 5, 8),  # Columns
+        (0, 4, 8), (2, 4, 6)  # Diagonals
+    )
+
     def __init__(self, player1: discord.Member, player2: discord.Member):
         self.board = [0] * 9
         self.player1 = player1
@@ -275,16 +371,12 @@ class TicTacToeGame:
         return True
 
     def check_winner(self):
-        # Winning combinations
-        wins = [
-            [0, 1, 2], [3, 4, 5], [6, 7, 8],  # Rows
-            [0, 3, 6], [1, 4, 7], [2, 5, 8],  # Columns
-            [0, 4, 8], [2, 4, 6]  # Diagonals
-        ]
-
-        for combo in wins:
-            if self.board[combo[0]] == self.board[combo[1]] == self.board[combo[2]] != 0:
-                self.winner = self.board[combo[0]]
+        board = self.board
+        for a, b, c in self.WINS:
+            value = board[a]
+            # Skip lines that start on an empty cell
+            if value and value == board[b] == board[c]:
+                self.winner = value
                 self.game_over = True
                 return
 
@@ -325,13 +417,15 @@ class TicTacToeView(View):
 
             # Update button
             symbols = {0: "⬜", 1: "❌", 2: "⭕"}
-            self.children[position].label = symbols[self.game.board[position]]
-            self.children[position].disabled = True
+            children = self.children
+            button = children[position]
+            button.label = symbols[self.game.board[position]]
+            button.disabled = True
 
             if self.game.current_player == 1:
-                self.children[position].style = discord.ButtonStyle.danger
+                button.style = discord.ButtonStyle.danger
             else:
-                self.children[position].style = discord.ButtonStyle.primary
+                button.style = discord.ButtonStyle.primary
 
             embed = interaction.message.embeds[0] if interaction.message.embeds else discord.Embed()
 
@@ -344,7 +438,7 @@ class TicTacToeView(View):
                     embed.title = "🤝 It's a tie!"
                     embed.color = discord.Color.orange()
 
-                for item in self.children:
+                for item in children:
                     item.disabled = True
             else:
                 current = self.game.get_current_member()
@@ -363,6 +457,17 @@ class TicTacToeView(View):
 class RPSView(View):
     """View for Rock Paper Scissors"""
 
+    CHOICES = ("rock", "paper", "scissors")
+    CHOICE_INDEX = {choice: i for i, choice in enumerate(CHOICES)}
+    EMOJIS = ("🪨", "📄", "✂️")
+
+    # OUTCOMES[p1][p2]: 1 = player 1 wins, -1 = player 2 wins, 0 = tie
+    OUTCOMES = (
+        (0, -1, 1),   # rock
+        (1, 0, -1),   # paper
+        (-1, 1, 0)    # scissors
+    )
+
     def __init__(self, player1: discord.Member, player2: discord.Member):
         super().__init__(timeout=60)
         self.player1 = player1
@@ -391,7 +496,7 @@ class RPSView(View):
             await interaction.response.send_message("You already chose!", ephemeral=True)
             return
 
-        self.choices[interaction.user.id] = choice
+        self.choices[interaction.user.id] = self.CHOICE_INDEX[choice]
         await interaction.response.send_message(f"You chose **{choice}**!", ephemeral=True)
 
         # Check if both players have chosen
@@ -406,14 +511,12 @@ class RPSView(View):
         c2 = self.choices[self.player2.id]
 
         # Determine winner
-        emojis = {"rock": "🪨", "paper": "📄", "scissors": "✂️"}
+        outcome = self.OUTCOMES[c1][c2]
 
-        if c1 == c2:
+        if outcome == 0:
             result = "🤝 It's a tie!"
             color = discord.Color.orange()
-        elif (c1 == "rock" and c2 == "scissors") or \
-             (c1 == "paper" and c2 == "rock") or \
-             (c1 == "scissors" and c2 == "paper"):
+        elif outcome == 1:
             result = f"🎉 {self.player1.display_name} wins!"
             color = discord.Color.green()
         else:
@@ -423,8 +526,8 @@ class RPSView(View):
         embed = discord.Embed(
             title=result,
             description=(
-                f"{self.player1.display_name}: {emojis[c1]} {c1}\n"
-                f"{self.player2.display_name}: {emojis[c2]} {c2}"
+                f"{self.player1.display_name}: {self.EMOJIS[c1]} {self.CHOICES[c1]}\n"
+                f"{self.player2.display_name}: {self.EMOJIS[c2]} {self.CHOICES[c2]}"
             ),
             color=color
         )
@@ -444,6 +547,92 @@ class Games(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.session: Optional[aiohttp.ClientSession] = None  # Shared HTTP session for trivia
+        self.trivia_lock = asyncio.Lock()  # Open Trivia DB requests go out one at a time
+        self.last_trivia_request = 0.0  # Event loop time of the last Open Trivia DB request
+        self.prefetch_trivia.start()
+
+    async def cog_unload(self):
+        self.prefetch_trivia.cancel()
+        if self.session:
+            await self.session.close()
+
+    @tasks.loop(minutes=5)
+    async def prefetch_trivia(self):
+        """Keep every trivia pool that has been used topped up"""
+        low_pools = [
+            key for key, pool in list(_trivia_cache.items())
+            if len(pool) < TRIVIA_PREFETCH_THRESHOLD
+        ]
+
+        # One pool at a time - request_trivia spaces the requests out for the rate limit
+        for category, difficulty in low_pools:
+            try:
+                response_code = await self.fetch_trivia_batch(category, difficulty)
+            except Exception as e:
+                logger.error(f"Trivia prefetch error: {e}")
+                continue
+
+            # Rate limited - back off until the next run
+            if response_code == TRIVIA_RATE_LIMITED:
+                logger.warning("Trivia prefetch rate limited by Open Trivia DB, backing off")
+                break
+
+    @prefetch_trivia.before_loop
+    async def before_prefetch_trivia(self):
+        await self.bot.wait_until_ready()
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=10),
+                connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+            )
+        return self.session
+
+    async def request_trivia(self, amount: int, category: Optional[str], difficulty: Optional[str]) -> dict:
+        """Request trivia questions from Open Trivia DB"""
+        # Build API URL
+        # url3986 encoding lets us decode with urllib's unquote instead of html.unescape
+        url = f"https://opentdb.com/api.php?amount={amount}&type=multiple&encode=url3986"
+        if category:
+            url += f"&category={TRIVIA_CATEGORY_IDS[category]}"
+        if difficulty:
+            url += f"&difficulty={difficulty}"
+
+        # Keep at least TRIVIA_REQUEST_INTERVAL between requests (shared with prefetching)
+        loop = asyncio.get_running_loop()
+        async with self.trivia_lock:
+            wait = self.last_trivia_request + TRIVIA_REQUEST_INTERVAL - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            try:
+                async with self.get_session().get(url) as resp:
+                    return await resp.json()
+            finally:
+                self.last_trivia_request = loop.time()
+
+    async def fetch_trivia_batch(self, category: Optional[str], difficulty: Optional[str]) -> int:
+        """Fetch a batch of trivia questions into the cache pool, returns the API response code"""
+        key = (category, difficulty)
+        data = await self.request_trivia(_trivia_batch_sizes[key], category, difficulty)
+
+        # Small categories/difficulties can't fill a full batch - fall back to single questions
+        if data["response_code"] == TRIVIA_NO_RESULTS and _trivia_batch_sizes[key] > 1:
+            _trivia_batch_sizes[key] = 1
+            data = await self.request_trivia(1, category, difficulty)
+
+        if data["response_code"] != TRIVIA_OK:
+            logger.warning(
+                f"Open Trivia DB returned response code {data['response_code']} "
+                f"(category={category}, difficulty={difficulty})"
+            )
+            return data["response_code"]
+
+        _trivia_cache[key].extend(data["results"])
+        return TRIVIA_OK
 
     @app_commands.command(name="trivia", description="Start a trivia game")
     @app_commands.describe(
@@ -462,43 +651,22 @@ class Games(commands.Cog):
         """Start a trivia game"""
         await interaction.response.defer()
 
-        # Map categories to Open Trivia DB IDs
-        category_map = {
-            "General Knowledge": 9,
-            "Science": 17,
-            "History": 23,
-            "Geography": 22,
-            "Entertainment": 11,
-            "Sports": 21,
-            "Art": 25,
-            "Animals": 27,
-            "Vehicles": 28,
-            "Computers": 18
-        }
-
-        # Build API URL
-        url = "https://opentdb.com/api.php?amount=1&type=multiple"
-        if category:
-            url += f"&category={category_map[category]}"
-        if difficulty:
-            url += f"&difficulty={difficulty}"
-
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as resp:
-                    data = await resp.json()
+            # Serve from the local pool, only hitting the API when it's empty
+            pool = _trivia_cache[(category, difficulty)]
+            if not pool:
+                await self.fetch_trivia_batch(category, difficulty)
 
-            if data["response_code"] != 0 or not data["results"]:
+            if not pool:
                 await interaction.followup.send("Couldn't fetch a trivia question. Try again!")
                 return
 
-            question_data = data["results"][0]
+            question_data = pool.popleft()
 
-            # Decode HTML entities
-            import html
-            question = html.unescape(question_data["question"])
-            correct = html.unescape(question_data["correct_answer"])
-            incorrect = [html.unescape(a) for a in question_data["incorrect_answers"]]
+            # Decode URL-encoded text
+            question = unquote(question_data["question"])
+            correct = unquote(question_data["correct_answer"])
+            incorrect = [unquote(a) for a in question_data["incorrect_answers"]]
 
             # Shuffle answers
             all_answers = [correct] + incorrect
@@ -510,8 +678,8 @@ class Games(commands.Cog):
                 description=question,
                 color=discord.Color.blue()
             )
-            embed.add_field(name="Category", value=question_data["category"], inline=True)
-            embed.add_field(name="Difficulty", value=question_data["difficulty"].capitalize(), inline=True)
+            embed.add_field(name="Category", value=unquote(question_data["category"]), inline=True)
+            embed.add_field(name="Difficulty", value=unquote(question_data["difficulty"]).capitalize(), inline=True)
             embed.set_footer(text="You have 30 seconds to answer!")
 
             view = TriviaView(correct, all_answers)
@@ -545,48 +713,27 @@ class Games(commands.Cog):
         mine_count = min(mine_count, rows * cols - 1)
 
         # Create empty board
-        board = [[0 for _ in range(cols)] for _ in range(rows)]
+        board = [[0] * cols for _ in range(rows)]
 
-        # Place mines
-        mine_positions = random.sample(range(rows * cols), mine_count)
-        for pos in mine_positions:
-            r, c = pos // cols, pos % cols
+        # Place mines and bump the count of every neighbouring cell
+        for pos in _rng.sample(range(rows * cols), mine_count):
+            r, c = divmod(pos, cols)
             board[r][c] = -1
 
-        # Calculate numbers
         for r in range(rows):
             for c in range(cols):
-                if board[r][c] == -1:
+                if board[r][c] != -1:
                     continue
 
-                count = 0
-                for dr in [-1, 0, 1]:
-                    for dc in [-1, 0, 1]:
-                        nr, nc = r + dr, c + dc
-                        if 0 <= nr < rows and 0 <= nc < cols and board[nr][nc] == -1:
-                            count += 1
-                board[r][c] = count
+                for nr in range(max(r - 1, 0), min(r + 2, rows)):
+                    row = board[nr]
+                    for nc in range(max(c - 1, 0), min(c + 2, cols)):
+                        if row[nc] != -1:
+                            row[nc] += 1
 
         # Convert to spoiler text
-        emojis = {
-            -1: "💥",
-            0: "⬜",
-            1: "1️⃣",
-            2: "2️⃣",
-            3: "3️⃣",
-            4: "4️⃣",
-            5: "5️⃣",
-            6: "6️⃣",
-            7: "7️⃣",
-            8: "8️⃣"
-        }
-
-        lines = []
-        for row in board:
-            line = " ".join(f"||{emojis[cell]}||" for cell in row)
-            lines.append(line)
-
-        board_text = "\n".join(lines)
+        tiles = MINESWEEPER_TILES
+        board_text = "\n".join(" ".join([tiles[cell] for cell in row]) for row in board)
 
         embed = discord.Embed(
             title="💣 Minesweeper",
@@ -616,16 +763,9 @@ class Games(commands.Cog):
         game = Connect4Game(interaction.user, opponent)
         view = Connect4View(game)
 
-        embed = discord.Embed(
-            title=f"Connect 4 - {interaction.user.display_name}'s turn",
-            description=game.render_board(),
-            color=discord.Color.blue()
-        )
-        embed.set_footer(text=f"🔴 {interaction.user.display_name}")
-
         await interaction.response.send_message(
             f"{opponent.mention}, you've been challenged to Connect 4!",
-            embed=embed,
+            embed=discord.Embed.from_dict(view.embed_dict),
             view=view
         )
 
@@ -696,21 +836,7 @@ class Games(commands.Cog):
     @app_commands.describe(question="Your question for the 8-ball")
     async def eightball(self, interaction: discord.Interaction, question: str):
         """Magic 8-ball"""
-        responses = [
-            # Positive
-            "It is certain.", "It is decidedly so.", "Without a doubt.",
-            "Yes, definitely.", "You may rely on it.", "As I see it, yes.",
-            "Most likely.", "Outlook good.", "Yes.", "Signs point to yes.",
-            # Neutral
-            "Reply hazy, try again.", "Ask again later.",
-            "Better not tell you now.", "Cannot predict now.",
-            "Concentrate and ask again.",
-            # Negative
-            "Don't count on it.", "My reply is no.", "My sources say no.",
-            "Outlook not so good.", "Very doubtful."
-        ]
-
-        response = random.choice(responses)
+        response = random.choice(EIGHTBALL_RESPONSES)
 
         embed = discord.Embed(
             title="🎱 Magic 8-Ball",
@@ -766,7 +892,7 @@ class Games(commands.Cog):
     @app_commands.command(name="coinflip", description="Flip a coin")
     async def coinflip(self, interaction: discord.Interaction):
         """Flip a coin"""
-        result = random.choice(["Heads", "Tails"])
+        result = random.choice(COIN_SIDES)
         emoji = "🪙"
 
         embed = discord.Embed(
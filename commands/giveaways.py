@@ -16,40 +16,148 @@ Commands:
 
 import discord
 from discord import app_commands
-from discord.ext import commands, tasks
+from discord.ext import commands
 from discord.ui import View, Button
-from typing import Optional, Literal, Tuple
-from datetime import datetime, timedelta
+from typing import Optional, Literal, Tuple, Dict
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from collections import OrderedDict
+import asyncio
+import time
 import re
 
 from utils.giveaways_db import (
     create_giveaway,
     enter_giveaway,
     leave_giveaway,
+    has_entered,
     end_giveaway,
     reroll_giveaway,
     get_giveaway,
     get_active_giveaways,
+    get_all_active_giveaways,
+    get_due_giveaways,
+    skip_giveaway_deadline,
     delete_giveaway,
     create_poll,
     vote_poll,
     end_poll,
     get_poll,
-    get_active_polls,
+    get_all_active_polls,
+    get_due_polls,
+    skip_poll_deadline,
+    get_next_ending_at,
+    get_ends_at_epoch,
     delete_poll
 )
 from utils.logger import logger
 
+# Bounds (in seconds) for how long the end checker sleeps between checks
+CHECK_MIN_INTERVAL = 5
+CHECK_MAX_INTERVAL = 300
+
+# How many giveaways/polls can be ended at the same time
+MAX_CONCURRENT_ENDINGS = 8
+
+
+# Precompiled patterns for message links and durations (e.g. 30m, 1h, 1d, 1w)
+MESSAGE_LINK_RE = re.compile(r'https?://(?:ptb\.|canary\.)?discord(?:app)?\.com/channels/(\d+)/(\d+)/(\d+)')
+DURATION_RE = re.compile(r"(\d+)([mhdw])")
+
+# Duration unit -> timedelta keyword
+DURATION_UNITS = {
+    "m": "minutes",
+    "h": "hours",
+    "d": "days",
+    "w": "weeks"
+}
+
+
+def parse_duration(duration: str) -> Optional[timedelta]:
+    """Parse a duration like 30m, 1h, 1d or 1w into a timedelta"""
+    match = DURATION_RE.match(duration.lower())
+    if not match:
+        return None
+    return timedelta(**{DURATION_UNITS[match.group(2)]: int(match.group(1))})
+
 
 def parse_message_link(link: str) -> Tuple[Optional[int], Optional[int], Optional[int]]:
     """Parse a Discord message link to extract guild_id, channel_id, and message_id"""
-    pattern = r'https?://(?:ptb\.|canary\.)?discord(?:app)?\.com/channels/(\d+)/(\d+)/(\d+)'
-    match = re.match(pattern, link.strip())
+    match = MESSAGE_LINK_RE.match(link.strip())
     if match:
         return int(match.group(1)), int(match.group(2)), int(match.group(3))
     return None, None, None
 
 
+# Position of the "Entries" field in the giveaway embed (Ends, Winners, Entries)
+GIVEAWAY_ENTRIES_FIELD = 2
+
+# Number emojis for the first 10 poll options
+POLL_EMOJIS = ("1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟")
+
+# Every possible poll progress bar (0-10 filled blocks)
+POLL_BAR_LENGTH = 10
+POLL_BARS = tuple("▓" * i + "░" * (POLL_BAR_LENGTH - i) for i in range(POLL_BAR_LENGTH + 1))
+
+# Last successfully rendered state per message, used to skip no-op edits
+_last_render: Dict[int, tuple] = {}
+
+
+def render_changed(message_id: int, state: tuple) -> bool:
+    """Check if a message's rendered state differs from what was last sent"""
+    return _last_render.get(message_id) != state
+
+
+def forget_render(message_id: int):
+    """Drop the remembered render state of an ended or deleted giveaway/poll"""
+    _last_render.pop(message_id, None)
+
+
+# How long to wait before editing a giveaway/poll message, so bursts of clicks share one edit
+EDIT_DEBOUNCE_SECONDS = 0.5
+
+# Message IDs with an edit already scheduled
+_pending_edits: set = set()
+
+# Running edit tasks (asyncio only keeps weak references to tasks)
+_edit_tasks: set = set()
+
+
+def schedule_edit(message: discord.Message, render):
+    """
+    Edit a message once after a short delay, coalescing clicks that happen in between
+
+    render() is called when the edit fires and returns (state, embed, view), or None to skip the edit.
+    The state is remembered once the edit succeeds, for render_changed.
+    """
+    if message.id in _pending_edits:
+        return
+    _pending_edits.add(message.id)
+
+    async def send_edit():
+        try:
+            await asyncio.sleep(EDIT_DEBOUNCE_SECONDS)
+        finally:
+            _pending_edits.discard(message.id)
+
+        rendered = render()
+        if not rendered:
+            return
+
+        state, embed, view = rendered
+        try:
+            await message.edit(embed=embed, view=view)
+        except discord.HTTPException as e:
+            logger.error(f"Error updating giveaway/poll message: {e}")
+            return
+
+        _last_render[message.id] = state
+
+    task = asyncio.create_task(send_edit())
+    _edit_tasks.add(task)
+    task.add_done_callback(_edit_tasks.discard)
+
+
 # ============================================
 # VIEW COMPONENTS - GIVEAWAY
 # ============================================
@@ -83,10 +191,11 @@ class GiveawayButton(Button):
             )
             return
 
-        # Check required role
-        if giveaway.get("required_role_id"):
-            role = interaction.guild.get_role(giveaway["required_role_id"])
-            if role and role not in interaction.user.roles:
+        # Check required role (by ID, only looking up the role for the error message)
+        required_role_id = giveaway.get("required_role_id")
+        if required_role_id and interaction.user.get_role(required_role_id) is None:
+            role = interaction.guild.get_role(required_role_id)
+            if role:
                 await interaction.response.send_message(
                     f"You need the {role.name} role to enter this giveaway!",
                     ephemeral=True
@@ -94,7 +203,7 @@ class GiveawayButton(Button):
                 return
 
         # Check if already entered
-        if interaction.user.id in giveaway["entries"]:
+        if has_entered(giveaway, interaction.user.id):
             # Leave the giveaway
             success, message = leave_giveaway(
                 interaction.guild.id,
@@ -111,19 +220,28 @@ class GiveawayButton(Button):
             )
             emoji = "🎉"
 
-        # Update button count
-        updated = get_giveaway(interaction.guild.id, interaction.message.id)
-        if updated:
-            view = GiveawayView(len(updated["entries"]))
-            embed = interaction.message.embeds[0] if interaction.message.embeds else None
-            if embed:
+        # Update button count (batched with other clicks in the next moment)
+        guild_id = interaction.guild.id
+        message_obj = interaction.message
+
+        def render():
+            current = get_giveaway(guild_id, message_obj.id)
+            if not current or current["ended"]:
+                return None
+
+            entry_count = len(current["entries"])
+            state = (entry_count,)
+            if not render_changed(message_obj.id, state):
+                return None
+
+            embed = message_obj.embeds[0] if message_obj.embeds else None
+            if embed and len(embed.fields) > GIVEAWAY_ENTRIES_FIELD:
                 # Update entries field
-                for i, field in enumerate(embed.fields):
-                    if field.name == "Entries":
-                        embed.set_field_at(i, name="Entries", value=str(len(updated["entries"])), inline=True)
-                        break
+                embed.set_field_at(GIVEAWAY_ENTRIES_FIELD, name="Entries", value=str(entry_count), inline=True)
+
+            return state, embed, GiveawayView(entry_count)
 
-            await interaction.message.edit(embed=embed, view=view)
+        schedule_edit(message_obj, render)
 
         await interaction.response.send_message(f"{emoji} {message}", ephemeral=True)
 
@@ -179,17 +297,24 @@ class PollButton(Button):
         )
 
         if success:
-            # Update the view
-            updated_poll = get_poll(interaction.guild.id, interaction.message.id)
-            if updated_poll:
-                view = PollView(updated_poll)
+            # Update the view and embed (batched with other votes in the next moment)
+            guild_id = interaction.guild.id
+            message_obj = interaction.message
+
+            def render():
+                current = get_poll(guild_id, message_obj.id)
+                if not current or current["ended"]:
+                    return None
+
+                vote_counts = tuple(len(opt["votes"]) for opt in current["options"])
+                if not render_changed(message_obj.id, vote_counts):
+                    return None
 
-                # Update embed
-                embed = interaction.message.embeds[0] if interaction.message.embeds else None
-                if embed:
-                    embed = create_poll_embed(updated_poll)
+                view = get_poll_view(message_obj.id, current, vote_counts)
+                embed = create_poll_embed(current) if message_obj.embeds else None
+                return vote_counts, embed, view
 
-                await interaction.message.edit(embed=embed, view=view)
+            schedule_edit(message_obj, render)
 
         await interaction.response.send_message(f"📊 {message}", ephemeral=True)
 
@@ -200,8 +325,9 @@ class PollView(View):
     def __init__(self, poll: dict):
         super().__init__(timeout=None)
 
+        add_item = self.add_item
         for i, option in enumerate(poll["options"][:25]):
-            self.add_item(PollButton(
+            add_item(PollButton(
                 option_index=i,
                 label=option["label"],
                 emoji=option.get("emoji", ""),
@@ -209,6 +335,37 @@ class PollView(View):
             ))
 
 
+# Built poll views keyed by (message_id, vote counts), so a repeated vote state reuses its buttons
+POLL_VIEW_CACHE_SIZE = 256
+_poll_view_cache: "OrderedDict[tuple, PollView]" = OrderedDict()
+
+
+def get_poll_view(message_id: int, poll: dict, vote_counts: tuple) -> PollView:
+    """Get a cached PollView for this vote state, building it on a miss"""
+    key = (message_id, vote_counts)
+    view = _poll_view_cache.get(key)
+    if view is not None:
+        _poll_view_cache.move_to_end(key)
+        return view
+
+    view = PollView(poll)
+    _poll_view_cache[key] = view
+    if len(_poll_view_cache) > POLL_VIEW_CACHE_SIZE:
+        _poll_view_cache.popitem(last=False)
+    return view
+
+
+@lru_cache(maxsize=1024)
+def format_poll_line(emoji: str, label: str, votes: int, total_votes: int) -> str:
+    """Format one option's result line (cached, so options whose counts didn't change aren't re-rendered)"""
+    percentage = (votes / total_votes * 100) if total_votes > 0 else 0
+
+    # Create progress bar
+    bar = POLL_BARS[int(POLL_BAR_LENGTH * percentage / 100)]
+
+    return f"{emoji} **{label}**\n{bar} {percentage:.1f}% ({votes})"
+
+
 def create_poll_embed(poll: dict) -> discord.Embed:
     """Create an embed showing poll results"""
     total_votes = sum(len(opt["votes"]) for opt in poll["options"])
@@ -218,26 +375,19 @@ def create_poll_embed(poll: dict) -> discord.Embed:
         color=discord.Color.blue()
     )
 
-    results = []
-    for opt in poll["options"]:
-        votes = len(opt["votes"])
-        percentage = (votes / total_votes * 100) if total_votes > 0 else 0
-
-        # Create progress bar
-        bar_length = 10
-        filled = int(bar_length * percentage / 100)
-        bar = "▓" * filled + "░" * (bar_length - filled)
-
-        emoji = opt.get("emoji", "")
-        results.append(f"{emoji} **{opt['label']}**\n{bar} {percentage:.1f}% ({votes})")
+    results = [
+        format_poll_line(opt.get("emoji", ""), opt["label"], len(opt["votes"]), total_votes)
+        for opt in poll["options"]
+    ]
 
     embed.description = "\n\n".join(results)
     embed.set_footer(text=f"Total votes: {total_votes}")
 
-    if poll.get("ends_at"):
+    ends_at_epoch = get_ends_at_epoch(poll)
+    if ends_at_epoch is not None:
         embed.add_field(
             name="Ends",
-            value=f"<t:{int(datetime.fromisoformat(poll['ends_at']).timestamp())}:R>",
+            value=f"<t:{int(ends_at_epoch)}:R>",
             inline=True
         )
 
@@ -253,46 +403,86 @@ class Giveaways(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.check_endings.start()
+        self.check_task: Optional[asyncio.Task] = None
+        self.wakeup = asyncio.Event()  # Set when a new deadline may be earlier than the current sleep
 
     def cog_unload(self):
-        self.check_endings.cancel()
+        if self.check_task:
+            self.check_task.cancel()
 
     async def cog_load(self):
         """Register persistent views"""
-        for guild in self.bot.guilds:
-            # Restore giveaway views
-            for giveaway in get_active_giveaways(guild.id):
-                view = GiveawayView(len(giveaway["entries"]))
-                self.bot.add_view(view, message_id=giveaway["message_id"])
-
-            # Restore poll views
-            for poll in get_active_polls(guild.id):
-                view = PollView(poll)
-                self.bot.add_view(view, message_id=poll["message_id"])
-
-    @tasks.loop(seconds=30)
+        # Restore giveaway views
+        for giveaway in get_all_active_giveaways():
+            view = GiveawayView(len(giveaway["entries"]))
+            self.bot.add_view(view, message_id=giveaway["message_id"])
+
+        # Restore poll views
+        for poll in get_all_active_polls():
+            view = PollView(poll)
+            self.bot.add_view(view, message_id=poll["message_id"])
+
+        self.check_task = asyncio.create_task(self.check_endings_loop())
+
+    async def check_endings_loop(self):
+        """Sleep until the next giveaway/poll is due instead of polling on a fixed timer"""
+        await self.bot.wait_until_ready()
+
+        while True:
+            self.wakeup.clear()
+
+            try:
+                await self.check_endings()
+            except Exception as e:
+                logger.error(f"Error checking giveaway/poll endings: {e}")
+
+            # Work out how long until the next deadline
+            next_end = get_next_ending_at()
+            if next_end:
+                delay = next_end - time.time()
+            else:
+                delay = CHECK_MAX_INTERVAL
+            delay = min(max(delay, CHECK_MIN_INTERVAL), CHECK_MAX_INTERVAL)
+
+            # Wake up early if a new giveaway/poll is created
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
     async def check_endings(self):
         """Check for giveaways/polls that need to end"""
-        now = datetime.utcnow()
-
-        for guild in self.bot.guilds:
-            # Check giveaways
-            for giveaway in get_active_giveaways(guild.id):
-                ends_at = datetime.fromisoformat(giveaway["ends_at"])
-                if now >= ends_at:
-                    await self.auto_end_giveaway(guild, giveaway)
-
-            # Check polls
-            for poll in get_active_polls(guild.id):
-                if poll.get("ends_at"):
-                    ends_at = datetime.fromisoformat(poll["ends_at"])
-                    if now >= ends_at:
-                        await self.auto_end_poll(guild, poll)
-
-    @check_endings.before_loop
-    async def before_check(self):
-        await self.bot.wait_until_ready()
+        now = time.time()
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_ENDINGS)
+
+        async def run_limited(coro):
+            async with semaphore:
+                await coro
+
+        endings = []
+
+        # Check giveaways
+        for guild_id, giveaway in get_due_giveaways(now):
+            guild = self.bot.get_guild(guild_id)
+            if guild:
+                endings.append(run_limited(self.auto_end_giveaway(guild, giveaway)))
+            else:
+                # Server is gone - stop waking up for it (it's re-checked after a restart)
+                skip_giveaway_deadline(giveaway["message_id"])
+
+        # Check polls
+        for guild_id, poll in get_due_polls(now):
+            guild = self.bot.get_guild(guild_id)
+            if guild:
+                endings.append(run_limited(self.auto_end_poll(guild, poll)))
+            else:
+                skip_poll_deadline(poll["message_id"])
+
+        # End them concurrently so one slow message fetch doesn't hold up the rest
+        results = await asyncio.gather(*endings, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error ending giveaway/poll: {result}")
 
     async def auto_end_giveaway(self, guild: discord.Guild, giveaway: dict):
         """Automatically end a giveaway"""
@@ -301,6 +491,8 @@ class Giveaways(commands.Cog):
         if not success:
             return
 
+        forget_render(giveaway["message_id"])
+
         try:
             channel = guild.get_channel(giveaway["channel_id"])
             if not channel:
@@ -356,6 +548,8 @@ class Giveaways(commands.Cog):
         if not success:
             return
 
+        forget_render(poll["message_id"])
+
         try:
             channel = guild.get_channel(poll["channel_id"])
             if not channel:
@@ -388,9 +582,10 @@ class Giveaways(commands.Cog):
 
             # Disable buttons
             view = View()
+            style = discord.ButtonStyle.secondary
             for opt in poll["options"][:25]:
                 view.add_item(Button(
-                    style=discord.ButtonStyle.secondary,
+                    style=style,
                     label=f"{opt['label']} ({len(opt['votes'])})",
                     emoji=opt.get("emoji") if opt.get("emoji") else None,
                     disabled=True
@@ -429,28 +624,14 @@ class Giveaways(commands.Cog):
     ):
         """Start a new giveaway"""
         # Parse duration
-        duration_match = re.match(r"(\d+)([mhdw])", duration.lower())
-        if not duration_match:
+        delta = parse_duration(duration)
+        if delta is None:
             await interaction.response.send_message(
                 "Invalid duration! Use format like: 1h, 30m, 1d, 1w",
                 ephemeral=True
             )
             return
 
-        amount = int(duration_match.group(1))
-        unit = duration_match.group(2)
-
-        if unit == "m":
-            delta = timedelta(minutes=amount)
-        elif unit == "h":
-            delta = timedelta(hours=amount)
-        elif unit == "d":
-            delta = timedelta(days=amount)
-        elif unit == "w":
-            delta = timedelta(weeks=amount)
-        else:
-            delta = timedelta(hours=1)
-
         ends_at = datetime.utcnow() + delta
 
         # Create embed
@@ -461,11 +642,11 @@ class Giveaways(commands.Cog):
         )
         embed.add_field(
             name="Ends",
-            value=f"<t:{int(ends_at.timestamp())}:R>",
+            value=f"<t:{int(ends_at.replace(tzinfo=timezone.utc).timestamp())}:R>",
             inline=True
         )
         embed.add_field(name="Winners", value=str(winners), inline=True)
-        embed.add_field(name="Entries", value="0", inline=True)
+        embed.add_field(name="Entries", value="0", inline=True)  # Must stay at GIVEAWAY_ENTRIES_FIELD
 
         if required_role:
             embed.add_field(
@@ -494,6 +675,7 @@ class Giveaways(commands.Cog):
         )
 
         self.bot.add_view(view, message_id=msg.id)
+        self.wakeup.set()
 
         await interaction.followup.send(
             f"Giveaway started! ID: `{giveaway_id}`",
@@ -528,6 +710,7 @@ class Giveaways(commands.Cog):
 
         await interaction.response.defer()
         await self.auto_end_giveaway(interaction.guild, giveaway)
+        forget_render(msg_id)
         await interaction.followup.send("Giveaway ended!", ephemeral=True)
 
     @giveaway_group.command(name="reroll", description="Reroll giveaway winners")
@@ -600,13 +783,12 @@ class Giveaways(commands.Cog):
         )
 
         for g in giveaways[:10]:
-            ends_at = datetime.fromisoformat(g["ends_at"])
             msg_link = f"https://discord.com/channels/{interaction.guild.id}/{g['channel_id']}/{g['message_id']}"
             embed.add_field(
                 name=g["prize"],
                 value=(
                     f"Entries: {len(g['entries'])} | Winners: {g['winners_count']}\n"
-                    f"Ends: <t:{int(ends_at.timestamp())}:R>\n"
+                    f"Ends: <t:{int(get_ends_at_epoch(g))}:R>\n"
                     f"[Jump to Giveaway]({msg_link})"
                 ),
                 inline=False
@@ -638,6 +820,8 @@ class Giveaways(commands.Cog):
         success, message = delete_giveaway(interaction.guild.id, msg_id)
 
         if success:
+            forget_render(msg_id)
+
             # Try to delete the message
             try:
                 channel = interaction.guild.get_channel(giveaway["channel_id"])
@@ -696,32 +880,16 @@ class Giveaways(commands.Cog):
         # Parse duration if provided
         ends_at = None
         if duration:
-            duration_match = re.match(r"(\d+)([mhdw])", duration.lower())
-            if duration_match:
-                amount = int(duration_match.group(1))
-                unit = duration_match.group(2)
-
-                if unit == "m":
-                    delta = timedelta(minutes=amount)
-                elif unit == "h":
-                    delta = timedelta(hours=amount)
-                elif unit == "d":
-                    delta = timedelta(days=amount)
-                elif unit == "w":
-                    delta = timedelta(weeks=amount)
-                else:
-                    delta = timedelta(hours=1)
-
+            delta = parse_duration(duration)
+            if delta is not None:
                 ends_at = (datetime.utcnow() + delta).isoformat()
 
         # Build poll options
         poll_options = []
-        emojis = ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟"]
-
         for i, opt in enumerate(option_list):
             poll_options.append({
                 "label": opt,
-                "emoji": emojis[i] if i < len(emojis) else "",
+                "emoji": POLL_EMOJIS[i] if i < len(POLL_EMOJIS) else "",
                 "votes": []
             })
 
@@ -754,6 +922,8 @@ class Giveaways(commands.Cog):
         )
 
         self.bot.add_view(view, message_id=msg.id)
+        if ends_at:
+            self.wakeup.set()
 
         await interaction.followup.send(
             f"Poll created! ID: `{poll_id}`",
@@ -788,6 +958,7 @@ class Giveaways(commands.Cog):
 
         await interaction.response.defer()
         await self.auto_end_poll(interaction.guild, poll)
+        forget_render(msg_id)
         await interaction.followup.send("Poll ended!", ephemeral=True)
 
     @poll_group.command(name="results", description="View poll results")
@@ -841,6 +1012,8 @@ class Giveaways(commands.Cog):
         success, message = delete_poll(interaction.guild.id, msg_id)
 
         if success:
+            forget_render(msg_id)
+
             try:
                 channel = interaction.guild.get_channel(poll["channel_id"])
                 msg = await channel.fetch_message(msg_id)
@@ -16,8 +16,8 @@ import random
 import asyncio
 
 import config
-from utils.logger import log_command, logger
-from utils.economy_db import get_balance, add_coins, remove_coins, record_gamble
+from utils.logger import log_command_soon, logger
+from utils.economy_db import remove_coins, settle_gamble
 from utils.achievements_data import update_user_stat, check_and_complete_achievements, get_user_stats
 
 
@@ -25,6 +25,28 @@ from utils.achievements_data import update_user_stat, check_and_complete_achieve
 MIN_NUMBER = 1
 MAX_NUMBER = 500
 MULTIPLIER = 500  # 500x payout for correct guess
+MAX_BET = 1000
+
+# Colors for embeds
+COLOR_GOLD = 0xF1C40F      # discord.Color.gold()
+COLOR_RED = 0xE74C3C       # discord.Color.red()
+
+# Static response text
+MAX_BET_MESSAGE = f"Maximum bet for this game is **{MAX_BET:,}** coins! (It's very risky!)"
+
+# "How close was it" text indexed by distance from the winning number
+CLOSE_MESSAGES = tuple(
+    "SO CLOSE! Just 1 off!" if difference == 1
+    else f"Close! Only {difference} away." if difference <= 5
+    else f"Not bad, {difference} away." if difference <= 10
+    else f"Off by {difference}."
+    for difference in range(MAX_NUMBER - MIN_NUMBER + 1)
+)
+
+# Dedicated RNG for this game (not security sensitive, so no secrets module)
+# randrange is bound once so the draw skips randint's extra argument handling
+_rng = random.Random()
+_pick = _rng.randrange
 
 
 class GuessNumber(commands.Cog):
@@ -33,94 +55,34 @@ class GuessNumber(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
-    @app_commands.command(name="guessnumber", description="Guess 1-500 for 500x payout! High risk, high reward!")
-    @app_commands.describe(
-        bet="Amount of coins to bet",
-        guess="Your guess (1-500)"
-    )
-    async def guessnumber(
+    async def resolve_game(
         self,
-        interaction: discord.Interaction,
+        guild_id: int,
+        user_id: int,
+        guess: int,
         bet: int,
-        guess: int
-    ):
-        """Play the guess the number game"""
-        log_command(str(interaction.user), interaction.user.id, f"guessnumber {bet} {guess}", interaction.guild.name)
-
-        # Validate guess
-        if guess < MIN_NUMBER or guess > MAX_NUMBER:
-            await interaction.response.send_message(
-                f"Your guess must be between **{MIN_NUMBER}** and **{MAX_NUMBER}**!",
-                ephemeral=True
-            )
-            return
-
-        # Validate bet
-        if bet <= 0:
-            await interaction.response.send_message(
-                "Bet must be a positive number!",
-                ephemeral=True
-            )
-            return
-
-        if bet > 1000:
-            await interaction.response.send_message(
-                "Maximum bet for this game is **1,000** coins! (It's very risky!)",
-                ephemeral=True
-            )
-            return
-
-        # Check balance
-        balance = get_balance(interaction.guild.id, interaction.user.id)
-        if balance < bet:
-            await interaction.response.send_message(
-                f"You don't have enough coins! Your balance: **{balance:,}** coins",
-                ephemeral=True
-            )
-            return
-
-        # Take the bet
-        remove_coins(interaction.guild.id, interaction.user.id, bet)
-
-        # Initial embed - suspense
-        embed = discord.Embed(
-            title="Guess the Number",
-            description=f"You guessed **{guess}**...\n\nGenerating random number between 1-500...",
-            color=discord.Color.gold()
-        )
-        embed.add_field(name="Your Bet", value=f"**{bet:,}** coins", inline=True)
-        embed.add_field(name="Potential Win", value=f"**{bet * MULTIPLIER:,}** coins", inline=True)
-        embed.add_field(
-            name="Odds",
-            value=f"1 in {MAX_NUMBER} chance (0.2%)",
-            inline=True
-        )
-        embed.set_footer(text=f"Player: {interaction.user.display_name}")
-
-        await interaction.response.send_message(embed=embed)
-
-        # Build suspense
-        await asyncio.sleep(2)
-
+        balance: int,
+        payout: int,
+        bet_str: str,
+        payout_str: str
+    ) -> discord.Embed:
+        """Draw the number, settle the bet and build the result embed"""
         # Generate the winning number
         # Special luck for specific user (10% chance to win)
         LUCKY_USER_ID = 324070041601441813
-        if interaction.user.id == LUCKY_USER_ID and random.randint(1, 10) == 1:
+        if user_id == LUCKY_USER_ID and _pick(10) == 0:
             # Lucky user gets 10% chance - force a win
             winning_number = guess
         else:
             # Normal odds for everyone else (1/500)
-            winning_number = random.randint(MIN_NUMBER, MAX_NUMBER)
+            winning_number = _pick(MIN_NUMBER, MAX_NUMBER + 1)
 
         won = (guess == winning_number)
 
-        user_id = interaction.user.id
         if won:
             # JACKPOT!
-            payout = bet * MULTIPLIER
             profit = payout - bet
-            add_coins(interaction.guild.id, interaction.user.id, payout, source="guessnumber_jackpot")
-            record_gamble(interaction.guild.id, interaction.user.id, bet, True, profit)
+            new_balance = settle_gamble(guild_id, user_id, bet, True, payout, source="guessnumber_jackpot")
 
             # Track achievements
             try:
@@ -137,20 +99,18 @@ class GuessNumber(commands.Cog):
                 title="JACKPOT!!!",
                 description=f"# The number was **{winning_number}**!\n\n"
                            f"🎉🎉🎉 **INCREDIBLE!** 🎉🎉🎉\n\n"
-                           f"You guessed correctly and won **{payout:,}** coins!",
-                color=discord.Color.gold()
+                           f"You guessed correctly and won **{payout_str}** coins!",
+                color=COLOR_GOLD
             )
             result_embed.add_field(name="Your Guess", value=f"**{guess}**", inline=True)
             result_embed.add_field(name="Winning Number", value=f"**{winning_number}**", inline=True)
             result_embed.add_field(name="Multiplier", value=f"**{MULTIPLIER}x**", inline=True)
-            result_embed.add_field(name="Your Winnings", value=f"**+{payout:,}** coins", inline=False)
-
-            new_balance = get_balance(interaction.guild.id, interaction.user.id)
+            result_embed.add_field(name="Your Winnings", value=f"**+{payout_str}** coins", inline=False)
             result_embed.add_field(name="New Balance", value=f"**{new_balance:,}** coins", inline=True)
 
         else:
             # Lost
-            record_gamble(interaction.guild.id, interaction.user.id, bet, False)
+            settle_gamble(guild_id, user_id, bet, False)
 
             # Reset win streak
             try:
@@ -160,33 +120,104 @@ class GuessNumber(commands.Cog):
 
             # Determine how close they were
             difference = abs(guess - winning_number)
-            if difference == 1:
-                close_msg = "SO CLOSE! Just 1 off!"
-            elif difference <= 5:
-                close_msg = f"Close! Only {difference} away."
-            elif difference <= 10:
-                close_msg = f"Not bad, {difference} away."
-            else:
-                close_msg = f"Off by {difference}."
+            close_msg = CLOSE_MESSAGES[difference]
 
             result_embed = discord.Embed(
                 title="Not This Time...",
                 description=f"# The number was **{winning_number}**\n\n"
                            f"You guessed **{guess}**. {close_msg}\n\n"
-                           f"You lost **{bet:,}** coins.",
-                color=discord.Color.red()
+                           f"You lost **{bet_str}** coins.",
+                color=COLOR_RED
             )
             result_embed.add_field(name="Your Guess", value=f"**{guess}**", inline=True)
             result_embed.add_field(name="Winning Number", value=f"**{winning_number}**", inline=True)
             result_embed.add_field(name="Difference", value=f"**{difference}**", inline=True)
-
-            new_balance = get_balance(interaction.guild.id, interaction.user.id)
-            result_embed.add_field(name="New Balance", value=f"**{new_balance:,}** coins", inline=True)
+            result_embed.add_field(name="New Balance", value=f"**{balance:,}** coins", inline=True)
 
             # Encouragement
             result_embed.set_footer(text="The odds are 1 in 500... Keep trying!")
 
-        await interaction.edit_original_response(embed=result_embed)
+        return result_embed
+
+    @app_commands.command(name="guessnumber", description="Guess 1-500 for 500x payout! High risk, high reward!")
+    @app_commands.describe(
+        bet="Amount of coins to bet",
+        guess="Your guess (1-500)",
+        fast="Skip the suspense and show the result straight away"
+    )
+    async def guessnumber(
+        self,
+        interaction: discord.Interaction,
+        bet: int,
+        guess: int,
+        fast: bool = False
+    ):
+        """Play the guess the number game"""
+        user = interaction.user
+        guild = interaction.guild
+        user_id = user.id
+        guild_id = guild.id
+
+        log_command_soon(user.name, user_id, f"guessnumber {bet} {guess}", guild.name)
+
+        # Validate guess
+        if guess < MIN_NUMBER or guess > MAX_NUMBER:
+            await interaction.response.send_message(
+                f"Your guess must be between **{MIN_NUMBER}** and **{MAX_NUMBER}**!",
+                ephemeral=True
+            )
+            return
+
+        # Validate bet
+        if bet <= 0:
+            await interaction.response.send_message(
+                "Bet must be a positive number!",
+                ephemeral=True
+            )
+            return
+
+        if bet > MAX_BET:
+            await interaction.response.send_message(
+                MAX_BET_MESSAGE,
+                ephemeral=True
+            )
+            return
+
+        # Take the bet (fails without changes if the balance is too low)
+        success, balance = remove_coins(guild_id, user_id, bet)
+        if not success:
+            await interaction.response.send_message(
+                f"You don't have enough coins! Your balance: **{balance:,}** coins",
+                ephemeral=True
+            )
+            return
+
+        payout = bet * MULTIPLIER
+        bet_str = f"{bet:,}"
+        payout_str = f"{payout:,}"
+
+        # Fast mode: respond with the result straight away, no suspense delay
+        if fast:
+            result_embed = await self.resolve_game(
+                guild_id, user_id, guess, bet,
+                balance, payout, bet_str, payout_str
+            )
+            await interaction.response.send_message(embed=result_embed)
+            return
+
+        # Acknowledge with Discord's "thinking" state as the suspense,
+        # and settle the game while the delay runs
+        await interaction.response.defer(thinking=True)
+        result_task = asyncio.create_task(self.resolve_game(
+            guild_id, user_id, guess, bet,
+            balance, payout, bet_str, payout_str
+        ))
+
+        # Build suspense
+        await asyncio.sleep(2)
+
+        result_embed = await result_task
+        await interaction.followup.send(embed=result_embed)
 
 
 # Required setup function
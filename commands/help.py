@@ -7,19 +7,112 @@ IMPORTANT: Update this file when adding new commands!
 NOTE: Discord embeds have a 25 field limit - keep categories consolidated!
 """
 
+from functools import lru_cache
+from typing import Optional
+
 import discord
 from discord import app_commands
 from discord.ext import commands
 
 import config
-from utils.logger import log_command, logger
-
-
-def user_has_permission(user: discord.Member, permission: str) -> bool:
-    """Check if a user has a specific permission"""
-    if permission is None:
-        return True
-    return getattr(user.guild_permissions, permission, False)
+from utils.logger import log_command_soon, logger
+
+# Permission bits used to key the prebuilt embeds
+FLAG_MOD = 1
+FLAG_ADMIN = 2
+FLAG_OWNER = 4
+
+# Raw Discord permission bits checked for each tier
+ADMIN_PERMS_MASK = discord.Permissions(administrator=True).value
+MOD_PERMS_MASK = discord.Permissions(manage_messages=True, moderate_members=True).value
+
+# Colors for embeds
+COLOR_BLUE = 0x3498DB      # discord.Color.blue()
+
+# Static embed text
+HELP_TITLE = f"{config.BOT_NAME} - Commands"
+HELP_DESCRIPTION = "Here's a quick overview of available commands.\nUse `/information` for detailed descriptions."
+HELP_FOOTER = f"{config.BOT_NAME} v{config.BOT_VERSION} • Use /information for details"
+
+# =============================================================================
+# HELP FIELDS - (name, value) pairs per permission tier
+# =============================================================================
+
+# Everyone
+EVERYONE_FIELDS = (
+    ("📌 General", "`/help` `/ping` `/information` `/invitegojo` `/dq` `/67` `/start` `/remind` `/reminders`"),
+    ("🎮 Games & Fun", "`/trivia` `/minesweeper` `/connect4` `/tictactoe` `/rps` `/8ball` `/roll`"),
+    ("🎨 Profile", "`/profile` `/profilecard` `/profilecolor` `/profilepresets` `/profilemotto` `/profilebanner` `/profilebadges` `/profilefeature`"),
+    ("💰 Economy & Gambling", "`/balance` `/claimdaily` `/leaderboard` `/blackjack` `/roulette` `/roulettenumber` `/coinflip` `/guessnumber`"),
+    ("🏦 Vault & Stocks", "`/vault` | `/invest` `/sell` `/portfolio` `/stockprice`"),
+    ("🛒 Shop & Quests", "`/shop` `/buy` `/inventory` `/quests` `/questkeys` `/lootbox` `/lootboxodds`"),
+    ("📊 Leveling & Milestones", "`/xpleaderboard` `/levels` `/rep` `/repleaderboard` `/milestones` `/serverhistory`"),
+    ("🎵 Music & Karaoke", "`/play` `/playlist` `/queue` `/nowplaying` `/pause` `/skip` `/stop` `/volume` `/shuffle` | `/karaoke`"),
+    ("🔊 Voice Channels", "`/tempvc panel` `/vcsignal` `/vclink` `/audiostatus`"),
+)
+
+# Moderators (manage messages / moderate members)
+MOD_FIELDS = (
+    ("🛡️ Moderation", "`/moderationpanel` `/moderationdatabase` `/modtalk` `/clearqueue`"),
+)
+
+# Administrators
+ADMIN_FIELDS = (
+    ("👑 Admin Core", "`/adminprofile` `/webhook` `/givecoins` `/setup` `/dashboard` `/backfill` `/syncstats`"),
+    ("🎉 Giveaways & Polls", "`/giveaway start` `/giveaway end` `/giveaway reroll` | `/poll create` `/poll end` | `/customcmd create` `/customcmd list`"),
+    ("👋 Roles & Members", "`/reactionrole create` `/reactionrole addrole` | `/welcome enable` `/welcome channel` | `/goodbye enable` | `/autorole add`"),
+    ("📺 Voice & Feeds", "`/tempvc setup` | `/livealerts setup` `/livealerts add` | `/autonews setup`"),
+    ("🎫 Tickets & Starboard", "`/ticket setup` `/ticket panel` | `/starboard setup` `/starboard threshold` | `/autothread setup` `/autothread list`"),
+    ("⚙️ Config & Security", "`/serverconfig view` `/serverconfig toggle` | `/serverreports setup` | `/antiscam enable` `/antiscam settings`"),
+)
+
+# Server owner
+OWNER_FIELDS = (
+    ("🔐 Owner (Logs & System)", "`/setuplogs` `/editlogs` `/clearlogs` `/clearmessages` | `/system health` `/system errors` `/system servers`"),
+)
+
+
+@lru_cache(maxsize=1024)
+def permission_flags(perms_value: int, is_owner: bool) -> int:
+    """Turn a raw guild permission value into the help embed bitmask (memoized)"""
+    # (admins always see the mod section)
+    is_admin = bool(perms_value & ADMIN_PERMS_MASK)
+    is_mod = is_admin or bool(perms_value & MOD_PERMS_MASK)
+    return (is_owner << 2) | (is_admin << 1) | is_mod
+
+
+@lru_cache(maxsize=8)
+def build_help_embed(flags: int, thumbnail_url: Optional[str] = None) -> discord.Embed:
+    """
+    Build the help embed for one permission bitmask (memoized).
+    The returned embed is shared between calls - don't modify it.
+    """
+    # Pick the field groups this permission level can see
+    groups = [EVERYONE_FIELDS]
+    if flags & FLAG_MOD:
+        groups.append(MOD_FIELDS)
+    if flags & FLAG_ADMIN:
+        groups.append(ADMIN_FIELDS)
+    if flags & FLAG_OWNER:
+        groups.append(OWNER_FIELDS)
+
+    # Build the whole embed payload at once instead of add_field per entry
+    payload = {
+        "type": "rich",
+        "title": HELP_TITLE,
+        "description": HELP_DESCRIPTION,
+        "color": COLOR_BLUE,
+        "fields": [
+            {"name": name, "value": value, "inline": False}
+            for group in groups
+            for name, value in group
+        ],
+        "footer": {"text": HELP_FOOTER}
+    }
+    if thumbnail_url:
+        payload["thumbnail"] = {"url": thumbnail_url}
+
+    return discord.Embed.from_dict(payload)
 
 
 class Help(commands.Cog):
@@ -27,6 +120,8 @@ class Help(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        # Bot avatar URL, filled in on first use (bot.user may not exist yet)
+        self.thumbnail_url = None
 
     @app_commands.command(name="help", description="Shows all available commands")
     async def help(self, interaction: discord.Interaction):
@@ -35,169 +130,34 @@ class Help(commands.Cog):
         Usage: /help
         Shows only commands the user has permission to use
         """
-        # Log that someone used this command
-        guild_name = interaction.guild.name if interaction.guild else None
-        log_command(
-            user=str(interaction.user),
-            user_id=interaction.user.id,
+        guild = interaction.guild
+        user = interaction.user
+
+        # Log that someone used this command (after the response goes out)
+        guild_name = guild.name if guild else None
+        log_command_soon(
+            user=user.name,
+            user_id=user.id,
             command="help",
             guild=guild_name
         )
 
         # Check if in a server
-        if not interaction.guild:
+        if not guild:
             await interaction.response.send_message(
                 "This command works best in a server!",
                 ephemeral=True
             )
             return
 
-        # Get user permissions
-        perms = interaction.user.guild_permissions
-        is_mod = perms.manage_messages or perms.moderate_members
-        is_admin = perms.administrator
-        is_owner = interaction.user.id == interaction.guild.owner_id
-
-        # Create the embed
-        embed = discord.Embed(
-            title=f"{config.BOT_NAME} - Commands",
-            description="Here's a quick overview of available commands.\nUse `/information` for detailed descriptions.",
-            color=discord.Color.blue()
-        )
-
-        if self.bot.user:
-            embed.set_thumbnail(url=self.bot.user.display_avatar.url)
-
-        # ==================== EVERYONE COMMANDS ====================
-
-        # General Commands
-        embed.add_field(
-            name="📌 General",
-            value="`/help` `/ping` `/information` `/invitegojo` `/dq` `/67` `/start` `/remind` `/reminders`",
-            inline=False
-        )
-
-        # Games & Fun
-        embed.add_field(
-            name="🎮 Games & Fun",
-            value="`/trivia` `/minesweeper` `/connect4` `/tictactoe` `/rps` `/8ball` `/roll`",
-            inline=False
-        )
-
-        # Profile & Customization
-        embed.add_field(
-            name="🎨 Profile",
-            value="`/profile` `/profilecard` `/profilecolor` `/profilepresets` `/profilemotto` `/profilebanner` `/profilebadges` `/profilefeature`",
-            inline=False
-        )
-
-        # Economy & Gambling + Vault
-        embed.add_field(
-            name="💰 Economy & Gambling",
-            value="`/balance` `/claimdaily` `/leaderboard` `/blackjack` `/roulette` `/roulettenumber` `/coinflip` `/guessnumber`",
-            inline=False
-        )
-
-        # Vault (Shared Economy)
-        embed.add_field(
-            name="🏦 Vault & Stocks",
-            value="`/vault` | `/invest` `/sell` `/portfolio` `/stockprice`",
-            inline=False
-        )
-
-        # Shop & Quests
-        embed.add_field(
-            name="🛒 Shop & Quests",
-            value="`/shop` `/buy` `/inventory` `/quests` `/questkeys` `/lootbox` `/lootboxodds`",
-            inline=False
-        )
-
-        # Leveling & Milestones
-        embed.add_field(
-            name="📊 Leveling & Milestones",
-            value="`/xpleaderboard` `/levels` `/rep` `/repleaderboard` `/milestones` `/serverhistory`",
-            inline=False
-        )
-
-        # Music & Karaoke
-        embed.add_field(
-            name="🎵 Music & Karaoke",
-            value="`/play` `/playlist` `/queue` `/nowplaying` `/pause` `/skip` `/stop` `/volume` `/shuffle` | `/karaoke`",
-            inline=False
-        )
-
-        # Voice Channels
-        embed.add_field(
-            name="🔊 Voice Channels",
-            value="`/tempvc panel` `/vcsignal` `/vclink` `/audiostatus`",
-            inline=False
-        )
-
-        # ==================== MODERATOR COMMANDS ====================
-
-        if is_mod or is_admin:
-            embed.add_field(
-                name="🛡️ Moderation",
-                value="`/moderationpanel` `/moderationdatabase` `/modtalk` `/clearqueue`",
-                inline=False
-            )
-
-        # ==================== ADMIN COMMANDS ====================
-
-        if is_admin:
-            # Core Admin
-            embed.add_field(
-                name="👑 Admin Core",
-                value="`/adminprofile` `/webhook` `/givecoins` `/setup` `/dashboard` `/backfill` `/syncstats`",
-                inline=False
-            )
-
-            # Giveaways, Polls & Custom Commands
-            embed.add_field(
-                name="🎉 Giveaways & Polls",
-                value="`/giveaway start` `/giveaway end` `/giveaway reroll` | `/poll create` `/poll end` | `/customcmd create` `/customcmd list`",
-                inline=False
-            )
+        # Get user permissions (keyed on plain ints so repeat lookups are cached)
+        flags = permission_flags(user.guild_permissions.value, user.id == guild.owner_id)
 
-            # Reaction Roles & Member Management
-            embed.add_field(
-                name="👋 Roles & Members",
-                value="`/reactionrole create` `/reactionrole addrole` | `/welcome enable` `/welcome channel` | `/goodbye enable` | `/autorole add`",
-                inline=False
-            )
-
-            # Voice & Feeds
-            embed.add_field(
-                name="📺 Voice & Feeds",
-                value="`/tempvc setup` | `/livealerts setup` `/livealerts add` | `/autonews setup`",
-                inline=False
-            )
-
-            # Tickets, Starboard & Threads
-            embed.add_field(
-                name="🎫 Tickets & Starboard",
-                value="`/ticket setup` `/ticket panel` | `/starboard setup` `/starboard threshold` | `/autothread setup` `/autothread list`",
-                inline=False
-            )
-
-            # Server Config, Reports & Security
-            embed.add_field(
-                name="⚙️ Config & Security",
-                value="`/serverconfig view` `/serverconfig toggle` | `/serverreports setup` | `/antiscam enable` `/antiscam settings`",
-                inline=False
-            )
-
-        # ==================== OWNER COMMANDS ====================
-
-        if is_owner:
-            embed.add_field(
-                name="🔐 Owner (Logs & System)",
-                value="`/setuplogs` `/editlogs` `/clearlogs` `/clearmessages` | `/system health` `/system errors` `/system servers`",
-                inline=False
-            )
+        if self.thumbnail_url is None and self.bot.user:
+            self.thumbnail_url = self.bot.user.display_avatar.url
 
-        # Footer
-        embed.set_footer(text=f"{config.BOT_NAME} v{config.BOT_VERSION} • Use /information for details")
+        # The command lists are static, so each permission combination is only built once
+        embed = build_help_embed(flags, self.thumbnail_url)
 
         await interaction.response.send_message(embed=embed)
 
@@ -11,10 +11,14 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from discord.ui import View, Button
-from typing import List, Dict
+from functools import lru_cache, partial, reduce
+from operator import or_
+from types import MappingProxyType
+from typing import Dict, NamedTuple, Optional, Tuple
 
 import config
 from utils.logger import log_command, logger
+from utils.permissions import PERMISSION_MASKS
 
 
 # =============================================================================
@@ -1265,8 +1269,44 @@ COMMANDS_REGISTRY = [
     },
 ]
 
-# Category display info
-CATEGORY_INFO = {
+
+class CommandEntry(NamedTuple):
+    """A single registry entry plus its pre-formatted display text"""
+    name: str
+    description: str
+    usage: str
+    category: str
+    permission: Optional[str]
+    summary: str   # "**/name** - short description" line for group pages
+    details: str   # Description, usage and required permission for category pages
+
+
+def _make_entry(cmd: dict) -> CommandEntry:
+    """Build a registry entry, formatting its display text once"""
+    # Truncate description if too long
+    short_desc = cmd["description"]
+    if len(short_desc) > 50:
+        short_desc = short_desc[:47] + "..."
+
+    # Add permission indicator
+    if cmd["permission"]:
+        perm_text = f"\n🔒 *Requires: {cmd['permission'].replace('_', ' ').title()}*"
+    else:
+        perm_text = ""
+
+    return CommandEntry(
+        **cmd,
+        summary=f"**{cmd['name']}** - {short_desc}",
+        details=f"{cmd['description']}\n📝 `{cmd['usage']}`{perm_text}"
+    )
+
+
+# Freeze the registry above into compact tuples once at import
+COMMANDS_REGISTRY = tuple(_make_entry(cmd) for cmd in COMMANDS_REGISTRY)
+TOTAL_COMMANDS = len(COMMANDS_REGISTRY)
+
+# Category display info (read-only)
+CATEGORY_INFO = MappingProxyType({
     "general": {
         "name": "General Commands",
         "emoji": "📌",
@@ -1452,28 +1492,503 @@ CATEGORY_INFO = {
         "emoji": "📊",
         "description": "Automated weekly server health reports"
     }
+})
+
+
+# Category page colors (shared, built once)
+CATEGORY_COLORS = {
+    "general": discord.Color.blue(),
+    "fun": discord.Color.gold(),
+    "games": discord.Color.from_rgb(114, 137, 218),  # Discord blurple for games
+    "profile": discord.Color.from_rgb(233, 30, 99),  # Pink for profile
+    "reminders": discord.Color.from_rgb(0, 188, 212),  # Cyan for reminders
+    "economy": discord.Color.from_rgb(255, 215, 0),  # Gold
+    "gambling": discord.Color.purple(),
+    "music": discord.Color.green(),
+    "karaoke": discord.Color.magenta(),
+    "achievements": discord.Color.from_rgb(255, 165, 0),  # Orange/Gold
+    "leveling": discord.Color.from_rgb(88, 101, 242),  # Discord Blurple
+    "reputation": discord.Color.gold(),  # Gold for reputation
+    "shop": discord.Color.teal(),  # Teal for shop
+    "quests": discord.Color.from_rgb(255, 193, 7),  # Amber for quests
+    "stocks": discord.Color.from_rgb(0, 200, 83),  # Green for stocks
+    "voicechannel": discord.Color.from_rgb(87, 242, 135),  # Discord green for VC
+    "polls": discord.Color.from_rgb(63, 81, 181),  # Indigo for polls
+    "giveaways": discord.Color.from_rgb(255, 152, 0),  # Orange for giveaways
+    "reactionroles": discord.Color.from_rgb(156, 39, 176),  # Purple for reaction roles
+    "customcommands": discord.Color.from_rgb(255, 235, 59),  # Yellow for custom commands
+    "welcome": discord.Color.from_rgb(76, 175, 80),  # Green for welcome
+    "goodbye": discord.Color.from_rgb(121, 85, 72),  # Brown for goodbye
+    "autorole": discord.Color.from_rgb(103, 58, 183),  # Deep purple for autorole
+    "moderation": discord.Color.orange(),
+    "support": discord.Color.from_rgb(96, 125, 139),  # Blue grey for support
+    "admin": discord.Color.red(),
+    "livealerts": discord.Color.purple(),  # Purple for live alerts (Twitch)
+    "autonews": discord.Color.from_rgb(255, 69, 0),  # Reddit orange
+    "owner": discord.Color.dark_red()
 }
+DEFAULT_CATEGORY_COLOR = discord.Color.blurple()
 
+# Define category groups to reduce page count
+# Each group combines related categories into one page
+CATEGORY_GROUPS = [
+    # Everyone categories
+    {
+        "name": "General & Fun",
+        "emoji": "🎮",
+        "color": discord.Color.blue(),
+        "categories": ["general", "fun", "games"]
+    },
+    {
+        "name": "Profile & Social",
+        "emoji": "🎨",
+        "color": discord.Color.from_rgb(233, 30, 99),
+        "categories": ["profile", "reminders", "reputation", "milestones"]
+    },
+    {
+        "name": "Economy & Gambling",
+        "emoji": "💰",
+        "color": discord.Color.gold(),
+        "categories": ["economy", "gambling", "shop", "quests", "stocks", "vault"]
+    },
+    {
+        "name": "Music & Entertainment",
+        "emoji": "🎵",
+        "color": discord.Color.green(),
+        "categories": ["music", "karaoke"]
+    },
+    {
+        "name": "Leveling & Achievements",
+        "emoji": "📊",
+        "color": discord.Color.from_rgb(88, 101, 242),
+        "categories": ["leveling", "achievements"]
+    },
+    {
+        "name": "Voice Channels",
+        "emoji": "🔊",
+        "color": discord.Color.from_rgb(87, 242, 135),
+        "categories": ["voicechannel"]
+    },
+    # Admin categories
+    {
+        "name": "Giveaways & Polls",
+        "emoji": "🎉",
+        "color": discord.Color.from_rgb(255, 152, 0),
+        "categories": ["giveaways", "polls"]
+    },
+    {
+        "name": "Roles & Custom Commands",
+        "emoji": "🏷️",
+        "color": discord.Color.purple(),
+        "categories": ["reactionroles", "customcommands"]
+    },
+    {
+        "name": "Member Management",
+        "emoji": "👋",
+        "color": discord.Color.from_rgb(76, 175, 80),
+        "categories": ["welcome", "goodbye", "autorole"]
+    },
+    {
+        "name": "Starboard & Threads",
+        "emoji": "⭐",
+        "color": discord.Color.gold(),
+        "categories": ["starboard", "autothread"]
+    },
+    {
+        "name": "Server Config & Reports",
+        "emoji": "⚙️",
+        "color": discord.Color.from_rgb(96, 125, 139),
+        "categories": ["serverconfig", "serverreports", "antiscam"]
+    },
+    {
+        "name": "Moderation",
+        "emoji": "🛡️",
+        "color": discord.Color.orange(),
+        "categories": ["moderation"]
+    },
+    {
+        "name": "Admin & Tickets",
+        "emoji": "👑",
+        "color": discord.Color.red(),
+        "categories": ["admin", "support"]
+    },
+    {
+        "name": "Feeds & Alerts",
+        "emoji": "📺",
+        "color": discord.Color.from_rgb(255, 69, 0),
+        "categories": ["livealerts", "autonews"]
+    },
+    {
+        "name": "Owner & System",
+        "emoji": "🔐",
+        "color": discord.Color.dark_red(),
+        "categories": ["owner", "system"]
+    },
+]
 
-def user_has_permission(user: discord.Member, permission: str) -> bool:
-    """Check if a user has a specific permission"""
-    if permission is None:
-        return True
-    return getattr(user.guild_permissions, permission, False)
+# Every permission bit the registry asks for, OR'd into one mask
+REGISTRY_PERMISSION_BITS = reduce(
+    or_,
+    {PERMISSION_MASKS[cmd.permission] for cmd in COMMANDS_REGISTRY if cmd.permission},
+    0
+)
 
 
-def get_user_commands(user: discord.Member) -> Dict[str, List[Dict]]:
-    """Get all commands the user has access to, organized by category"""
+@lru_cache(maxsize=32)
+def _commands_for_permissions(granted_bits: int) -> Dict[str, Tuple[CommandEntry, ...]]:
+    """Bucket the registry by category for one set of granted permission bits (memoized)"""
     accessible = {}
+    setdefault = accessible.setdefault
 
     for cmd in COMMANDS_REGISTRY:
-        if user_has_permission(user, cmd["permission"]):
-            category = cmd["category"]
-            if category not in accessible:
-                accessible[category] = []
-            accessible[category].append(cmd)
+        permission = cmd.permission
+        if permission is None or granted_bits & PERMISSION_MASKS[permission]:
+            setdefault(cmd.category, []).append(cmd)
+
+    # Freeze the buckets - this result is cached and shared between views
+    return {category: tuple(cmds) for category, cmds in accessible.items()}
+
+
+@lru_cache(maxsize=32)
+def _groups_for_permissions(granted_bits: int) -> Tuple[dict, ...]:
+    """Category groups with at least one command for these permission bits (memoized)"""
+    accessible = _commands_for_permissions(granted_bits)
+    return tuple(
+        group for group in CATEGORY_GROUPS
+        if any(cat in accessible for cat in group["categories"])
+    )
+
+
+@lru_cache(maxsize=128)
+def _group_page_fields(granted_bits: int, categories: Tuple[str, ...]) -> Tuple[Tuple[Tuple[str, str], ...], int]:
+    """(name, value) fields and command count for one group page and permission set (memoized)"""
+    accessible = _commands_for_permissions(granted_bits)
+    fields = []
+    total_commands = 0
+
+    # Add commands from each category in the group
+    for category in categories:
+        commands_list = accessible.get(category)
+        if not commands_list:
+            continue
+
+        cat_info = CATEGORY_INFO.get(category)
+        if cat_info is None:
+            cat_info = {"name": category.title(), "emoji": "📁"}
+
+        # Format commands compactly - group them to avoid hitting 25 field limit
+        # Show command name and brief description
+        cmd_lines = [cmd.summary for cmd in commands_list]
 
-    return accessible
+        # Split into chunks if too many commands (max ~1024 chars per field value)
+        chunk_size = 6  # commands per field
+        for i in range(0, len(cmd_lines), chunk_size):
+            chunk = cmd_lines[i:i + chunk_size]
+            field_name = f"{cat_info['emoji']} {cat_info['name']}" if i == 0 else f"{cat_info['name']} (cont.)"
+
+            if len(fields) < 24:  # Leave room for footer info
+                fields.append((field_name, "\n".join(chunk)))
+
+        total_commands += len(commands_list)
+
+    return tuple(fields), total_commands
+
+
+def get_permission_bits(user: discord.Member) -> int:
+    """The user's permission bits that matter to the registry (used as the cache key)"""
+    return user.guild_permissions.value & REGISTRY_PERMISSION_BITS
+
+
+def get_user_commands(user: discord.Member) -> Dict[str, Tuple[CommandEntry, ...]]:
+    """
+    Get all commands the user has access to, organized by category.
+    The result is shared by users with the same permissions - don't modify it.
+    """
+    return _commands_for_permissions(get_permission_bits(user))
+
+
+def get_user_groups(user: discord.Member) -> Tuple[dict, ...]:
+    """Get the category groups (pages) the user has commands in, in page order"""
+    return _groups_for_permissions(get_permission_bits(user))
+
+
+# =============================================================================
+# ACCESS LEVELS - (level, description) keyed by (administrator << 1) | moderator
+# =============================================================================
+
+ADMIN_PERMISSION_BITS = PERMISSION_MASKS["administrator"]
+MOD_PERMISSION_BITS = PERMISSION_MASKS["manage_messages"] | PERMISSION_MASKS["moderate_members"]
+
+ACCESS_MEMBER = 0b00
+ACCESS_LEVELS = {
+    0b11: ("👑 Administrator", "You have full access to all commands!"),
+    0b10: ("👑 Administrator", "You have full access to all commands!"),
+    0b01: ("🛡️ Moderator", "You have access to moderation commands"),
+    ACCESS_MEMBER: ("👤 Member", "You have access to general commands"),
+}
+
+
+def get_access_key(user: discord.Member) -> int:
+    """Pack the user's admin/moderator permissions into an ACCESS_LEVELS key"""
+    value = user.guild_permissions.value
+    return (bool(value & ADMIN_PERMISSION_BITS) << 1) | bool(value & MOD_PERMISSION_BITS)
+
+
+# =============================================================================
+# STATIC PAGE TEXT - built once at import instead of on every page build
+# =============================================================================
+
+# About page
+ABOUT_INTRO = (
+    f"**{config.BOT_NAME}** is a powerful Discord bot designed to help "
+    "manage your server with moderation tools, fun commands, and useful utilities.\n\n"
+    "Named after the strongest sorcerer from Jujutsu Kaisen, this bot aims to be "
+    "the strongest helper in your server!"
+)
+ABOUT_NAVIGATION = (
+    "Use the **dropdown menu** below to jump to any section:\n"
+    "• **Features** - Overview of bot capabilities\n"
+    "• **Command Categories** - Detailed command lists\n"
+    "• **Credits** - Acknowledgments"
+)
+
+# Features page - (name, value) field pairs
+
+# Features everyone can use
+FEATURE_FIELDS = (
+    # Music Features (Everyone)
+    (
+        "🔊 Music System",
+        "• **SoundCloud Integration** - Search and play from SoundCloud\n"
+        "• **Search & Play** - Search for any song by name\n"
+        "• **Direct Links** - Paste SoundCloud URLs directly\n"
+        "• **Queue System** - Queue up multiple songs with remove buttons\n"
+        "• **Playback Controls** - Pause, resume, skip, shuffle\n"
+        "• **Volume Control** - Adjust volume as needed\n"
+        "• **Lyrics** - View song lyrics via Genius integration\n"
+        "• **Audio Optimization** - Smooth playback with Opus codec support"
+    ),
+    # Karaoke Features (Everyone)
+    (
+        "🎤 Karaoke System",
+        "• **Solo Mode** - Spotlight on a single singer with countdown\n"
+        "• **Duet Mode** - Two singers with alternating lyric lines\n"
+        "• **5-Second Countdown** - Get ready before the music starts\n"
+        "• **Singer Spotlight** - Announces who's singing\n"
+        "• **Synced Lyrics** - Real-time lyrics display while singing\n"
+        "• **Song Library** - Browse available karaoke songs"
+    ),
+    # Economy System (Everyone)
+    (
+        "💰 Economy System",
+        "• **Virtual Coins** - Earn free coins (not purchasable with real money)\n"
+        "• **Daily Claims** - Claim coins daily with streak bonuses\n"
+        "• **Leaderboard** - Compete for the top spot\n"
+        "• **Balance Tracking** - View your coins and gambling stats"
+    ),
+    # Gambling System (Everyone)
+    (
+        "🎰 Gambling Games",
+        "• **Blackjack** - Classic card game vs dealer (1x-1.5x payout)\n"
+        "• **Roulette** - Bet on colors, numbers, or ranges (2x-36x payout)\n"
+        "• **Multi-Number Roulette** - Bet on multiple numbers at once!\n"
+        "• **Roulette Table** - View the visual betting table\n"
+        "• **Coinflip Duel** - Challenge other players for coins\n"
+        "• **Guess the Number** - High risk game with 500x payout!"
+    ),
+    # Achievement Features (Everyone)
+    (
+        "🏆 Achievement System",
+        "• **10 Unique Achievements** - Unlock achievements as you use the bot\n"
+        "• **Progress Tracking** - View your progress toward each achievement\n"
+        "• **Chat God** - Send 10,000 messages\n"
+        "• **Voice Veteran** - Spend 50 hours in voice channels\n"
+        "• **High Roller** - Win 50,000 coins from gambling\n"
+        "• **Wealthy Elite** - Have 100,000 coins at once\n"
+        "• **And More!** - Music, karaoke, daily streaks achievements"
+    ),
+    # Leveling System (Everyone)
+    (
+        "📊 Leveling System",
+        "• **Earn XP** - Get XP for messages (15-25 XP) and voice chat (10 XP/min)\n"
+        "• **Level Up** - Progress through levels with increasing XP requirements\n"
+        "• **Rank Cards** - Beautiful graphical rank cards with your avatar & stats\n"
+        "• **XP Leaderboard** - Compete for the top spot in your server\n"
+        "• **Milestone Rewards** - Earn bonus coins at levels 5, 10, 20, 50, 100!\n"
+        "• **Level 10: 5,000 coins** - Plus other milestone bonuses"
+    ),
+    # Reputation System (Everyone)
+    (
+        "⭐ Reputation System",
+        "• **Give Rep** - Recognize helpful members with `/rep @user`\n"
+        "• **Daily Limit** - One rep point per day to prevent spam\n"
+        "• **Rep Leaderboard** - See who the most helpful members are\n"
+        "• **Check Rep** - View anyone's reputation stats\n"
+        "• **Social Recognition** - Build your server's community lore"
+    ),
+    # Shop System (Everyone)
+    (
+        "🛒 Server Shop",
+        "• **XP Boosters** - Double XP for 2h, 6h, or 24h\n"
+        "• **Custom Roles** - Buy a custom colored role for 1 week or 1 month\n"
+        "• **Browse & Buy** - Use `/shop` to see items, `/buy` to purchase\n"
+        "• **Inventory** - Track your active items with `/inventory`\n"
+        "• **Auto-Expiry** - Temporary items are automatically removed when expired"
+    ),
+    # Daily Quests (Everyone)
+    (
+        " Daily Quest System",
+        "• **3 Daily Quests** - New quests every day at midnight UTC\n"
+        "• **Quest Variety** - Gambling, music, chat, voice, and social quests\n"
+        "• **Quest Keys** - Complete all 3 quests to earn a Quest Key\n"
+        "• **Lootboxes** - Open lootboxes for coins and rare roles!\n"
+        "• **Legendary Rewards** - Up to 50,000 coins and exclusive roles"
+    ),
+    # Stock Market (Everyone)
+    (
+        " Community Stock Market",
+        "• **Invest in Members** - Buy shares in active server members\n"
+        "• **Dynamic Prices** - Prices rise with messages, XP, and voice time\n"
+        "• **Buy & Sell** - Use `/invest` and `/sell` to trade\n"
+        "• **Portfolio Tracking** - View your holdings with `/portfolio`\n"
+        "• **Profit from Activity** - Invest in active members and sell high!"
+    ),
+    # Voice Channel Features (Everyone)
+    (
+        "🔊 Voice Channel Tools",
+        "• **Join-to-Create** - Join a channel to get your own private VC\n"
+        "• **VC Controls** - Rename, lock, set limits, kick/ban users\n"
+        "• **Auto-Transfer** - Ownership transfers when owner leaves\n"
+        "• **VC Signal** - Send private invites to friends with `/vcsignal`\n"
+        "• **Auto-Delete** - Empty channels are automatically cleaned up"
+    ),
+    # Games System (Everyone)
+    (
+        "🎮 Games System",
+        "• **Trivia** - Test your knowledge with multiple categories\n"
+        "• **Minesweeper** - Classic puzzle game in Discord\n"
+        "• **Connect 4** - Challenge friends to a strategy game\n"
+        "• **Tic Tac Toe** - Classic X's and O's\n"
+        "• **Rock Paper Scissors** - Quick duels vs bot or players\n"
+        "• **8-Ball** - Ask the magic 8-ball anything\n"
+        "• **Dice Rolling** - Roll any combination of dice"
+    ),
+    # Profile Cards (Everyone)
+    (
+        "🎨 Profile Cards",
+        "• **Graphical Cards** - Beautiful profile cards with your stats\n"
+        "• **Custom Colors** - Choose your accent color or use presets\n"
+        "• **Stats Display** - Shows level, XP, coins, reputation\n"
+        "• **Achievement Badges** - Display your earned badges"
+    ),
+    # Reminders (Everyone)
+    (
+        "⏰ Personal Reminders",
+        "• **DM Reminders** - Get reminded via DM when time is up\n"
+        "• **Flexible Timing** - 1h, 30m, 1d, 1w, or combinations\n"
+        "• **Repeating Reminders** - Daily or weekly repeat options\n"
+        "• **Manage Reminders** - View, delete, or clear all reminders"
+    ),
+    # Fun Features (Everyone)
+    (
+        "🎭 Fun & Entertainment",
+        "• **Daily Quotes** - Inspirational quotes from movies, anime & famous people\n"
+        "• **67 Command** - Unleash maximum cringe"
+    ),
+    # Onboarding (Everyone)
+    (
+        "🚀 Easy Onboarding",
+        "• **Interactive Start** - Use `/start` to learn all features\n"
+        "• **Setup Wizard** - Admins use `/setup` for easy configuration\n"
+        "• **Dashboard** - Quick overview with `/dashboard`\n"
+        "• **Welcome Message** - Auto-welcome when bot joins a server"
+    ),
+)
+
+# Only shown to staff (manage messages / moderate members / administrator)
+STAFF_FEATURE_FIELDS = (
+    # Ticket System (Staff)
+    (
+        "🎫 Support Ticket System",
+        "• **Button-Based Tickets** - Users click to open private support channels\n"
+        "• **Category Selection** - Support, Report, Appeal, or Other\n"
+        "• **Claim System** - Staff can claim tickets to handle them\n"
+        "• **Lock/Unlock** - Temporarily prevent user from typing\n"
+        "• **Transcripts** - Save ticket conversations to log channel\n"
+        "• **Safe Close** - Close with reopen option, delete confirmation"
+    ),
+    (
+        "📺 Live Stream Alerts",
+        "• **Twitch & YouTube** - Get alerts when streamers go live\n"
+        "• **Auto-Detection** - Bot checks every 5 minutes for new streams\n"
+        "• **Custom Channel** - Set which channel receives alerts\n"
+        "• **Role Pings** - Optionally ping a role when someone goes live\n"
+        "• **Rich Embeds** - Beautiful alerts with streamer info and links"
+    ),
+    (
+        "📰 Auto News Feeds",
+        "• **Reddit Integration** - Auto-post from any subreddit\n"
+        "• **RSS Support** - Subscribe to any RSS feed\n"
+        "• **Filter Options** - Choose hot, new, or top posts\n"
+        "• **Automatic Posts** - Bot fetches new content every 10 minutes\n"
+        "• **Rich Formatting** - Posts include titles, links, and thumbnails"
+    ),
+    (
+        "🎉 Giveaways & Polls",
+        "• **Button Giveaways** - One-click entry with live count\n"
+        "• **Timed Duration** - Auto-end after specified time\n"
+        "• **Multiple Winners** - Pick 1 or more winners\n"
+        "• **Role Requirements** - Require a role to enter\n"
+        "• **Reroll Winners** - Pick new winners anytime\n"
+        "• **Interactive Polls** - Button voting with live results"
+    ),
+    (
+        "🏷️ Reaction Roles",
+        "• **Button Panels** - Click to get/remove roles\n"
+        "• **Dropdown Menus** - Select roles from a dropdown\n"
+        "• **Single/Multi Mode** - Allow one or multiple roles\n"
+        "• **Custom Labels** - Set button text and descriptions\n"
+        "• **Emoji Support** - Add emojis to buttons"
+    ),
+    (
+        "⚡ Custom Commands",
+        "• **Keyword Triggers** - Auto-respond to specific words\n"
+        "• **Custom Prefix** - Set your own trigger prefix\n"
+        "• **Embed Responses** - Rich formatted responses\n"
+        "• **Variables** - Use {user}, {server}, {channel} placeholders"
+    ),
+    (
+        "👋 Welcome & Goodbye Cards",
+        "• **Visual Cards** - Beautiful image welcome/goodbye cards\n"
+        "• **Custom Backgrounds** - Set your own background image\n"
+        "• **DM Welcomes** - Optional DM message to new members\n"
+        "• **Auto Roles** - Automatically assign roles on join\n"
+        "• **Custom Messages** - Use {user}, {server}, {count} variables"
+    ),
+    (
+        "📝 Deep Logging",
+        "• **Message Tracking** - Edits, deletions with content\n"
+        "• **Member Events** - Joins, leaves, bans, unbans\n"
+        "• **Role/Nick Changes** - Track all member updates\n"
+        "• **Voice Activity** - Join, leave, move, mute/deafen\n"
+        "• **Channel Updates** - Create, delete, modify channels"
+    ),
+)
+
+# Shown last for everyone
+COMING_SOON_FIELD = (
+    "🚀 Coming Soon",
+    "• AI Chat Features (OpenRouter integration)\n"
+    "• Auto-moderation (word filters, spam protection)\n"
+    "• Social media alerts (Twitter, Instagram)\n"
+    "• And more!"
+)
+
+# Pointer to the staff category pages
+STAFF_NOTE_FIELD = (
+    "🔒 Staff Features",
+    "*You have access to additional commands. Browse the category pages to see moderation, admin, and owner tools.*"
+)
 
 
 class InformationView(View):
@@ -1483,120 +1998,38 @@ class InformationView(View):
         super().__init__(timeout=timeout)
         self.bot = bot
         self.user = user
+        self.user_id = user.id
         self.current_page = 1
-        self.accessible_commands = get_user_commands(user)
 
-        # Define category groups to reduce page count
-        # Each group combines related categories into one page
-        self.category_groups = [
-            # Everyone categories
-            {
-                "name": "General & Fun",
-                "emoji": "🎮",
-                "color": discord.Color.blue(),
-                "categories": ["general", "fun", "games"]
-            },
-            {
-                "name": "Profile & Social",
-                "emoji": "🎨",
-                "color": discord.Color.from_rgb(233, 30, 99),
-                "categories": ["profile", "reminders", "reputation", "milestones"]
-            },
-            {
-                "name": "Economy & Gambling",
-                "emoji": "💰",
-                "color": discord.Color.gold(),
-                "categories": ["economy", "gambling", "shop", "quests", "stocks", "vault"]
-            },
-            {
-                "name": "Music & Entertainment",
-                "emoji": "🎵",
-                "color": discord.Color.green(),
-                "categories": ["music", "karaoke"]
-            },
-            {
-                "name": "Leveling & Achievements",
-                "emoji": "📊",
-                "color": discord.Color.from_rgb(88, 101, 242),
-                "categories": ["leveling", "achievements"]
-            },
-            {
-                "name": "Voice Channels",
-                "emoji": "🔊",
-                "color": discord.Color.from_rgb(87, 242, 135),
-                "categories": ["voicechannel"]
-            },
-            # Admin categories
-            {
-                "name": "Giveaways & Polls",
-                "emoji": "🎉",
-                "color": discord.Color.from_rgb(255, 152, 0),
-                "categories": ["giveaways", "polls"]
-            },
-            {
-                "name": "Roles & Custom Commands",
-                "emoji": "🏷️",
-                "color": discord.Color.purple(),
-                "categories": ["reactionroles", "customcommands"]
-            },
-            {
-                "name": "Member Management",
-                "emoji": "👋",
-                "color": discord.Color.from_rgb(76, 175, 80),
-                "categories": ["welcome", "goodbye", "autorole"]
-            },
-            {
-                "name": "Starboard & Threads",
-                "emoji": "⭐",
-                "color": discord.Color.gold(),
-                "categories": ["starboard", "autothread"]
-            },
-            {
-                "name": "Server Config & Reports",
-                "emoji": "⚙️",
-                "color": discord.Color.from_rgb(96, 125, 139),
-                "categories": ["serverconfig", "serverreports", "antiscam"]
-            },
-            {
-                "name": "Moderation",
-                "emoji": "🛡️",
-                "color": discord.Color.orange(),
-                "categories": ["moderation"]
-            },
-            {
-                "name": "Admin & Tickets",
-                "emoji": "👑",
-                "color": discord.Color.red(),
-                "categories": ["admin", "support"]
-            },
-            {
-                "name": "Feeds & Alerts",
-                "emoji": "📺",
-                "color": discord.Color.from_rgb(255, 69, 0),
-                "categories": ["livealerts", "autonews"]
-            },
-            {
-                "name": "Owner & System",
-                "emoji": "🔐",
-                "color": discord.Color.dark_red(),
-                "categories": ["owner", "system"]
-            },
-        ]
+        # Resolved once and reused by every page
+        self.thumbnail_url = bot.user.display_avatar.url if bot.user else None
+        self.user_name = str(user)
+        self.access_key = get_access_key(user)
 
-        # Filter groups to only include those with accessible commands
-        self.accessible_groups = []
-        for group in self.category_groups:
-            # Check if user has access to any category in this group
-            has_access = any(cat in self.accessible_commands for cat in group["categories"])
-            if has_access:
-                self.accessible_groups.append(group)
+        # Commands and category group pages this user can see (shared per permission set)
+        self.permission_bits = get_permission_bits(user)
+        self.accessible_commands = get_user_commands(user)
+        self.accessible_count = sum(len(cmds) for cmds in self.accessible_commands.values())
+        self.accessible_groups = get_user_groups(user)
 
         # +3 for About, Features, and Credits pages
         self.total_pages = 3 + len(self.accessible_groups)
 
+        # Page builders in page order: About, Features, one per command group, Credits
+        self.page_builders = [self._build_about_embed, self._build_features_embed]
+        self.page_builders += [partial(self._build_group_embed, group) for group in self.accessible_groups]
+        self.page_builders.append(self._build_credits_embed)
+
+        # Built page embeds, keyed by page number (pages don't change while the view is open)
+        self.page_embeds: Dict[int, discord.Embed] = {}
+
+        # The page dropdown is created once and updated in place on navigation
+        self.page_select = self._build_page_select()
+        self.add_item(self.page_select)
+
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         """Only allow the original user to use the buttons"""
-        if interaction.user.id != self.user.id:
+        if interaction.user.id != self.user_id:
             await interaction.response.send_message(
                 "Only the person who ran the command can use these buttons!",
                 ephemeral=True
@@ -1605,21 +2038,12 @@ class InformationView(View):
         return True
 
     def get_page_embed(self) -> discord.Embed:
-        """Get the embed for the current page"""
-        if self.current_page == 1:
-            return self._build_about_embed()
-        elif self.current_page == 2:
-            return self._build_features_embed()
-        elif self.current_page == self.total_pages:
-            # Last page is Credits
-            return self._build_credits_embed()
-        else:
-            # Pages 3 to (total-1) are command category groups
-            group_index = self.current_page - 3
-            if 0 <= group_index < len(self.accessible_groups):
-                group = self.accessible_groups[group_index]
-                return self._build_group_embed(group)
-            return self._build_about_embed()
+        """Get the embed for the current page (each page is only built once)"""
+        embed = self.page_embeds.get(self.current_page)
+        if embed is None:
+            embed = self.page_builders[self.current_page - 1]()
+            self.page_embeds[self.current_page] = embed
+        return embed
 
     def _build_about_embed(self) -> discord.Embed:
         """Build the about/introduction embed (Page 1)"""
@@ -1629,47 +2053,26 @@ class InformationView(View):
             color=discord.Color.blue()
         )
 
-        if self.bot.user:
-            embed.set_thumbnail(url=self.bot.user.display_avatar.url)
+        if self.thumbnail_url:
+            embed.set_thumbnail(url=self.thumbnail_url)
 
         # Bot introduction
-        embed.add_field(
-            name="🤖 What is Gojo?",
-            value=(
-                f"**{config.BOT_NAME}** is a powerful Discord bot designed to help "
-                "manage your server with moderation tools, fun commands, and useful utilities.\n\n"
-                "Named after the strongest sorcerer from Jujutsu Kaisen, this bot aims to be "
-                "the strongest helper in your server!"
-            ),
-            inline=False
-        )
+        embed.add_field(name="🤖 What is Gojo?", value=ABOUT_INTRO, inline=False)
 
         # Quick stats
-        total_commands = len(COMMANDS_REGISTRY)
-        user_accessible = sum(len(cmds) for cmds in self.accessible_commands.values())
-
         embed.add_field(
             name="📊 Quick Stats",
             value=(
                 f"**Bot Version:** {config.BOT_VERSION}\n"
-                f"**Total Commands:** {total_commands}\n"
-                f"**Your Accessible Commands:** {user_accessible}\n"
+                f"**Total Commands:** {TOTAL_COMMANDS}\n"
+                f"**Your Accessible Commands:** {self.accessible_count}\n"
                 f"**Servers:** {len(self.bot.guilds)}"
             ),
             inline=True
         )
 
         # Your access level
-        perms = self.user.guild_permissions
-        if perms.administrator:
-            access_level = "👑 Administrator"
-            access_desc = "You have full access to all commands!"
-        elif perms.manage_messages or perms.moderate_members:
-            access_level = "🛡️ Moderator"
-            access_desc = "You have access to moderation commands"
-        else:
-            access_level = "👤 Member"
-            access_desc = "You have access to general commands"
+        access_level, access_desc = ACCESS_LEVELS[self.access_key]
 
         embed.add_field(
             name="🔑 Your Access Level",
@@ -1677,18 +2080,9 @@ class InformationView(View):
             inline=True
         )
 
-        embed.add_field(
-            name="📚 Navigation",
-            value=(
-                "Use the **dropdown menu** below to jump to any section:\n"
-                "• **Features** - Overview of bot capabilities\n"
-                "• **Command Categories** - Detailed command lists\n"
-                "• **Credits** - Acknowledgments"
-            ),
-            inline=False
-        )
+        embed.add_field(name="📚 Navigation", value=ABOUT_NAVIGATION, inline=False)
 
-        embed.set_footer(text=f"Requested by {self.user} • Use dropdown to navigate")
+        embed.set_footer(text=f"Requested by {self.user_name} • Use dropdown to navigate")
 
         return embed
 
@@ -1700,344 +2094,30 @@ class InformationView(View):
             color=discord.Color.gold()
         )
 
-        if self.bot.user:
-            embed.set_thumbnail(url=self.bot.user.display_avatar.url)
-
-        # Music Features (Everyone)
-        embed.add_field(
-            name="🔊 Music System",
-            value=(
-                "• **SoundCloud Integration** - Search and play from SoundCloud\n"
-                "• **Search & Play** - Search for any song by name\n"
-                "• **Direct Links** - Paste SoundCloud URLs directly\n"
-                "• **Queue System** - Queue up multiple songs with remove buttons\n"
-                "• **Playback Controls** - Pause, resume, skip, shuffle\n"
-                "• **Volume Control** - Adjust volume as needed\n"
-                "• **Lyrics** - View song lyrics via Genius integration\n"
-                "• **Audio Optimization** - Smooth playback with Opus codec support"
-            ),
-            inline=False
-        )
-
-        # Karaoke Features (Everyone)
-        embed.add_field(
-            name="🎤 Karaoke System",
-            value=(
-                "• **Solo Mode** - Spotlight on a single singer with countdown\n"
-                "• **Duet Mode** - Two singers with alternating lyric lines\n"
-                "• **5-Second Countdown** - Get ready before the music starts\n"
-                "• **Singer Spotlight** - Announces who's singing\n"
-                "• **Synced Lyrics** - Real-time lyrics display while singing\n"
-                "• **Song Library** - Browse available karaoke songs"
-            ),
-            inline=False
-        )
+        if self.thumbnail_url:
+            embed.set_thumbnail(url=self.thumbnail_url)
 
-        # Economy System (Everyone)
-        embed.add_field(
-            name="💰 Economy System",
-            value=(
-                "• **Virtual Coins** - Earn free coins (not purchasable with real money)\n"
-                "• **Daily Claims** - Claim coins daily with streak bonuses\n"
-                "• **Leaderboard** - Compete for the top spot\n"
-                "• **Balance Tracking** - View your coins and gambling stats"
-            ),
-            inline=False
-        )
-
-        # Gambling System (Everyone)
-        embed.add_field(
-            name="🎰 Gambling Games",
-            value=(
-                "• **Blackjack** - Classic card game vs dealer (1x-1.5x payout)\n"
-                "• **Roulette** - Bet on colors, numbers, or ranges (2x-36x payout)\n"
-                "• **Multi-Number Roulette** - Bet on multiple numbers at once!\n"
-                "• **Roulette Table** - View the visual betting table\n"
-                "• **Coinflip Duel** - Challenge other players for coins\n"
-                "• **Guess the Number** - High risk game with 500x payout!"
-            ),
-            inline=False
-        )
-
-        # Achievement Features (Everyone)
-        embed.add_field(
-            name="🏆 Achievement System",
-            value=(
-                "• **10 Unique Achievements** - Unlock achievements as you use the bot\n"
-                "• **Progress Tracking** - View your progress toward each achievement\n"
-                "• **Chat God** - Send 10,000 messages\n"
-                "• **Voice Veteran** - Spend 50 hours in voice channels\n"
-                "• **High Roller** - Win 50,000 coins from gambling\n"
-                "• **Wealthy Elite** - Have 100,000 coins at once\n"
-                "• **And More!** - Music, karaoke, daily streaks achievements"
-            ),
-            inline=False
-        )
-
-        # Leveling System (Everyone)
-        embed.add_field(
-            name="📊 Leveling System",
-            value=(
-                "• **Earn XP** - Get XP for messages (15-25 XP) and voice chat (10 XP/min)\n"
-                "• **Level Up** - Progress through levels with increasing XP requirements\n"
-                "• **Rank Cards** - Beautiful graphical rank cards with your avatar & stats\n"
-                "• **XP Leaderboard** - Compete for the top spot in your server\n"
-                "• **Milestone Rewards** - Earn bonus coins at levels 5, 10, 20, 50, 100!\n"
-                "• **Level 10: 5,000 coins** - Plus other milestone bonuses"
-            ),
-            inline=False
-        )
-
-        # Reputation System (Everyone)
-        embed.add_field(
-            name="⭐ Reputation System",
-            value=(
-                "• **Give Rep** - Recognize helpful members with `/rep @user`\n"
-                "• **Daily Limit** - One rep point per day to prevent spam\n"
-                "• **Rep Leaderboard** - See who the most helpful members are\n"
-                "• **Check Rep** - View anyone's reputation stats\n"
-                "• **Social Recognition** - Build your server's community lore"
-            ),
-            inline=False
-        )
-
-        # Shop System (Everyone)
-        embed.add_field(
-            name="🛒 Server Shop",
-            value=(
-                "• **XP Boosters** - Double XP for 2h, 6h, or 24h\n"
-                "• **Custom Roles** - Buy a custom colored role for 1 week or 1 month\n"
-                "• **Browse & Buy** - Use `/shop` to see items, `/buy` to purchase\n"
-                "• **Inventory** - Track your active items with `/inventory`\n"
-                "• **Auto-Expiry** - Temporary items are automatically removed when expired"
-            ),
-            inline=False
-        )
-
-        # Daily Quests (Everyone)
-        embed.add_field(
-            name=" Daily Quest System",
-            value=(
-                "• **3 Daily Quests** - New quests every day at midnight UTC\n"
-                "• **Quest Variety** - Gambling, music, chat, voice, and social quests\n"
-                "• **Quest Keys** - Complete all 3 quests to earn a Quest Key\n"
-                "• **Lootboxes** - Open lootboxes for coins and rare roles!\n"
-                "• **Legendary Rewards** - Up to 50,000 coins and exclusive roles"
-            ),
-            inline=False
-        )
-
-        # Stock Market (Everyone)
-        embed.add_field(
-            name=" Community Stock Market",
-            value=(
-                "• **Invest in Members** - Buy shares in active server members\n"
-                "• **Dynamic Prices** - Prices rise with messages, XP, and voice time\n"
-                "• **Buy & Sell** - Use `/invest` and `/sell` to trade\n"
-                "• **Portfolio Tracking** - View your holdings with `/portfolio`\n"
-                "• **Profit from Activity** - Invest in active members and sell high!"
-            ),
-            inline=False
-        )
-
-        # Voice Channel Features (Everyone)
-        embed.add_field(
-            name="🔊 Voice Channel Tools",
-            value=(
-                "• **Join-to-Create** - Join a channel to get your own private VC\n"
-                "• **VC Controls** - Rename, lock, set limits, kick/ban users\n"
-                "• **Auto-Transfer** - Ownership transfers when owner leaves\n"
-                "• **VC Signal** - Send private invites to friends with `/vcsignal`\n"
-                "• **Auto-Delete** - Empty channels are automatically cleaned up"
-            ),
-            inline=False
-        )
-
-        # Games System (Everyone)
-        embed.add_field(
-            name="🎮 Games System",
-            value=(
-                "• **Trivia** - Test your knowledge with multiple categories\n"
-                "• **Minesweeper** - Classic puzzle game in Discord\n"
-                "• **Connect 4** - Challenge friends to a strategy game\n"
-                "• **Tic Tac Toe** - Classic X's and O's\n"
-                "• **Rock Paper Scissors** - Quick duels vs bot or players\n"
-                "• **8-Ball** - Ask the magic 8-ball anything\n"
-                "• **Dice Rolling** - Roll any combination of dice"
-            ),
-            inline=False
-        )
-
-        # Profile Cards (Everyone)
-        embed.add_field(
-            name="🎨 Profile Cards",
-            value=(
-                "• **Graphical Cards** - Beautiful profile cards with your stats\n"
-                "• **Custom Colors** - Choose your accent color or use presets\n"
-                "• **Stats Display** - Shows level, XP, coins, reputation\n"
-                "• **Achievement Badges** - Display your earned badges"
-            ),
-            inline=False
-        )
-
-        # Reminders (Everyone)
-        embed.add_field(
-            name="⏰ Personal Reminders",
-            value=(
-                "• **DM Reminders** - Get reminded via DM when time is up\n"
-                "• **Flexible Timing** - 1h, 30m, 1d, 1w, or combinations\n"
-                "• **Repeating Reminders** - Daily or weekly repeat options\n"
-                "• **Manage Reminders** - View, delete, or clear all reminders"
-            ),
-            inline=False
-        )
-
-        # Fun Features (Everyone)
-        embed.add_field(
-            name="🎭 Fun & Entertainment",
-            value=(
-                "• **Daily Quotes** - Inspirational quotes from movies, anime & famous people\n"
-                "• **67 Command** - Unleash maximum cringe"
-            ),
-            inline=False
-        )
-
-        # Onboarding (Everyone)
-        embed.add_field(
-            name="🚀 Easy Onboarding",
-            value=(
-                "• **Interactive Start** - Use `/start` to learn all features\n"
-                "• **Setup Wizard** - Admins use `/setup` for easy configuration\n"
-                "• **Dashboard** - Quick overview with `/dashboard`\n"
-                "• **Welcome Message** - Auto-welcome when bot joins a server"
-            ),
-            inline=False
-        )
+        # Public features (Everyone)
+        for name, value in FEATURE_FIELDS:
+            embed.add_field(name=name, value=value, inline=False)
 
         # Staff-only features below
-        perms = self.user.guild_permissions
-        is_staff = perms.manage_messages or perms.moderate_members or perms.administrator
+        is_staff = self.access_key != ACCESS_MEMBER
 
-        # Ticket System (Staff)
         if is_staff:
-            embed.add_field(
-                name="🎫 Support Ticket System",
-                value=(
-                    "• **Button-Based Tickets** - Users click to open private support channels\n"
-                    "• **Category Selection** - Support, Report, Appeal, or Other\n"
-                    "• **Claim System** - Staff can claim tickets to handle them\n"
-                    "• **Lock/Unlock** - Temporarily prevent user from typing\n"
-                    "• **Transcripts** - Save ticket conversations to log channel\n"
-                    "• **Safe Close** - Close with reopen option, delete confirmation"
-                ),
-                inline=False
-            )
-
-            embed.add_field(
-                name="📺 Live Stream Alerts",
-                value=(
-                    "• **Twitch & YouTube** - Get alerts when streamers go live\n"
-                    "• **Auto-Detection** - Bot checks every 5 minutes for new streams\n"
-                    "• **Custom Channel** - Set which channel receives alerts\n"
-                    "• **Role Pings** - Optionally ping a role when someone goes live\n"
-                    "• **Rich Embeds** - Beautiful alerts with streamer info and links"
-                ),
-                inline=False
-            )
-
-            embed.add_field(
-                name="📰 Auto News Feeds",
-                value=(
-                    "• **Reddit Integration** - Auto-post from any subreddit\n"
-                    "• **RSS Support** - Subscribe to any RSS feed\n"
-                    "• **Filter Options** - Choose hot, new, or top posts\n"
-                    "• **Automatic Posts** - Bot fetches new content every 10 minutes\n"
-                    "• **Rich Formatting** - Posts include titles, links, and thumbnails"
-                ),
-                inline=False
-            )
-
-            embed.add_field(
-                name="🎉 Giveaways & Polls",
-                value=(
-                    "• **Button Giveaways** - One-click entry with live count\n"
-                    "• **Timed Duration** - Auto-end after specified time\n"
-                    "• **Multiple Winners** - Pick 1 or more winners\n"
-                    "• **Role Requirements** - Require a role to enter\n"
-                    "• **Reroll Winners** - Pick new winners anytime\n"
-                    "• **Interactive Polls** - Button voting with live results"
-                ),
-                inline=False
-            )
-
-            embed.add_field(
-                name="🏷️ Reaction Roles",
-                value=(
-                    "• **Button Panels** - Click to get/remove roles\n"
-                    "• **Dropdown Menus** - Select roles from a dropdown\n"
-                    "• **Single/Multi Mode** - Allow one or multiple roles\n"
-                    "• **Custom Labels** - Set button text and descriptions\n"
-                    "• **Emoji Support** - Add emojis to buttons"
-                ),
-                inline=False
-            )
-
-            embed.add_field(
-                name="⚡ Custom Commands",
-                value=(
-                    "• **Keyword Triggers** - Auto-respond to specific words\n"
-                    "• **Custom Prefix** - Set your own trigger prefix\n"
-                    "• **Embed Responses** - Rich formatted responses\n"
-                    "• **Variables** - Use {user}, {server}, {channel} placeholders"
-                ),
-                inline=False
-            )
-
-            embed.add_field(
-                name="👋 Welcome & Goodbye Cards",
-                value=(
-                    "• **Visual Cards** - Beautiful image welcome/goodbye cards\n"
-                    "• **Custom Backgrounds** - Set your own background image\n"
-                    "• **DM Welcomes** - Optional DM message to new members\n"
-                    "• **Auto Roles** - Automatically assign roles on join\n"
-                    "• **Custom Messages** - Use {user}, {server}, {count} variables"
-                ),
-                inline=False
-            )
-
-            embed.add_field(
-                name="📝 Deep Logging",
-                value=(
-                    "• **Message Tracking** - Edits, deletions with content\n"
-                    "• **Member Events** - Joins, leaves, bans, unbans\n"
-                    "• **Role/Nick Changes** - Track all member updates\n"
-                    "• **Voice Activity** - Join, leave, move, mute/deafen\n"
-                    "• **Channel Updates** - Create, delete, modify channels"
-                ),
-                inline=False
-            )
+            for name, value in STAFF_FEATURE_FIELDS:
+                embed.add_field(name=name, value=value, inline=False)
 
         # Coming Soon
-        embed.add_field(
-            name="🚀 Coming Soon",
-            value=(
-                "• AI Chat Features (OpenRouter integration)\n"
-                "• Auto-moderation (word filters, spam protection)\n"
-                "• Social media alerts (Twitter, Instagram)\n"
-                "• And more!"
-            ),
-            inline=False
-        )
+        name, value = COMING_SOON_FIELD
+        embed.add_field(name=name, value=value, inline=False)
 
         # Note about more features for staff
         if is_staff:
-            embed.add_field(
-                name="🔒 Staff Features",
-                value="*You have access to additional commands. Browse the category pages to see moderation, admin, and owner tools.*",
-                inline=False
-            )
+            name, value = STAFF_NOTE_FIELD
+            embed.add_field(name=name, value=value, inline=False)
 
-        embed.set_footer(text=f"Requested by {self.user} • Use buttons to navigate")
+        embed.set_footer(text=f"Requested by {self.user_name} • Use buttons to navigate")
 
         return embed
 
@@ -2049,65 +2129,32 @@ class InformationView(View):
             color=group['color']
         )
 
-        if self.bot.user:
-            embed.set_thumbnail(url=self.bot.user.display_avatar.url)
-
-        total_commands = 0
-        field_count = 0
-
-        # Add commands from each category in the group
-        for category in group['categories']:
-            if category not in self.accessible_commands:
-                continue
-
-            commands_list = self.accessible_commands[category]
-            if not commands_list:
-                continue
-
-            cat_info = CATEGORY_INFO.get(category, {"name": category.title(), "emoji": "📁"})
-
-            # Format commands compactly - group them to avoid hitting 25 field limit
-            # Show command name and brief description
-            cmd_lines = []
-            for cmd in commands_list:
-                # Truncate description if too long
-                desc = cmd['description']
-                if len(desc) > 50:
-                    desc = desc[:47] + "..."
-                cmd_lines.append(f"**{cmd['name']}** - {desc}")
-
-            # Split into chunks if too many commands (max ~1024 chars per field value)
-            chunk_size = 6  # commands per field
-            for i in range(0, len(cmd_lines), chunk_size):
-                chunk = cmd_lines[i:i + chunk_size]
-                field_name = f"{cat_info['emoji']} {cat_info['name']}" if i == 0 else f"{cat_info['name']} (cont.)"
-
-                if field_count < 24:  # Leave room for footer info
-                    embed.add_field(
-                        name=field_name,
-                        value="\n".join(chunk),
-                        inline=False
-                    )
-                    field_count += 1
-
-            total_commands += len(commands_list)
+        if self.thumbnail_url:
+            embed.set_thumbnail(url=self.thumbnail_url)
+
+        # Field text only depends on the group and the user's permissions, so it is shared
+        fields, total_commands = _group_page_fields(self.permission_bits, tuple(group['categories']))
+        for name, value in fields:
+            embed.add_field(name=name, value=value, inline=False)
 
         # Show command count
         embed.set_footer(
-            text=f"{total_commands} command(s) • Requested by {self.user} • Use buttons to navigate"
+            text=f"{total_commands} command(s) • Requested by {self.user_name} • Use buttons to navigate"
         )
 
         return embed
 
     def _build_category_embed(self, category: str) -> discord.Embed:
         """Build a command category embed (single category - legacy)"""
-        cat_info = CATEGORY_INFO.get(category, {
-            "name": category.title(),
-            "emoji": "📁",
-            "description": "Commands"
-        })
+        cat_info = CATEGORY_INFO.get(category)
+        if cat_info is None:
+            cat_info = {
+                "name": category.title(),
+                "emoji": "📁",
+                "description": "Commands"
+            }
 
-        commands_list = self.accessible_commands.get(category, [])
+        commands_list = self.accessible_commands.get(category, ())
 
         embed = discord.Embed(
             title=f"{cat_info['emoji']} {cat_info['name']}",
@@ -2115,64 +2162,27 @@ class InformationView(View):
             color=self._get_category_color(category)
         )
 
-        if self.bot.user:
-            embed.set_thumbnail(url=self.bot.user.display_avatar.url)
+        if self.thumbnail_url:
+            embed.set_thumbnail(url=self.thumbnail_url)
 
         # List commands in this category
         for cmd in commands_list:
-            # Add permission indicator
-            if cmd["permission"]:
-                perm_text = f"\n🔒 *Requires: {cmd['permission'].replace('_', ' ').title()}*"
-            else:
-                perm_text = ""
-
             embed.add_field(
-                name=f"**{cmd['name']}**",
-                value=f"{cmd['description']}\n📝 `{cmd['usage']}`{perm_text}",
+                name=f"**{cmd.name}**",
+                value=cmd.details,
                 inline=False
             )
 
         # Show command count
         embed.set_footer(
-            text=f"{len(commands_list)} command(s) • Requested by {self.user} • Use buttons to navigate"
+            text=f"{len(commands_list)} command(s) • Requested by {self.user_name} • Use buttons to navigate"
         )
 
         return embed
 
     def _get_category_color(self, category: str) -> discord.Color:
         """Get the color for a category"""
-        colors = {
-            "general": discord.Color.blue(),
-            "fun": discord.Color.gold(),
-            "games": discord.Color.from_rgb(114, 137, 218),  # Discord blurple for games
-            "profile": discord.Color.from_rgb(233, 30, 99),  # Pink for profile
-            "reminders": discord.Color.from_rgb(0, 188, 212),  # Cyan for reminders
-            "economy": discord.Color.from_rgb(255, 215, 0),  # Gold
-            "gambling": discord.Color.purple(),
-            "music": discord.Color.green(),
-            "karaoke": discord.Color.magenta(),
-            "achievements": discord.Color.from_rgb(255, 165, 0),  # Orange/Gold
-            "leveling": discord.Color.from_rgb(88, 101, 242),  # Discord Blurple
-            "reputation": discord.Color.gold(),  # Gold for reputation
-            "shop": discord.Color.teal(),  # Teal for shop
-            "quests": discord.Color.from_rgb(255, 193, 7),  # Amber for quests
-            "stocks": discord.Color.from_rgb(0, 200, 83),  # Green for stocks
-            "voicechannel": discord.Color.from_rgb(87, 242, 135),  # Discord green for VC
-            "polls": discord.Color.from_rgb(63, 81, 181),  # Indigo for polls
-            "giveaways": discord.Color.from_rgb(255, 152, 0),  # Orange for giveaways
-            "reactionroles": discord.Color.from_rgb(156, 39, 176),  # Purple for reaction roles
-            "customcommands": discord.Color.from_rgb(255, 235, 59),  # Yellow for custom commands
-            "welcome": discord.Color.from_rgb(76, 175, 80),  # Green for welcome
-            "goodbye": discord.Color.from_rgb(121, 85, 72),  # Brown for goodbye
-            "autorole": discord.Color.from_rgb(103, 58, 183),  # Deep purple for autorole
-            "moderation": discord.Color.orange(),
-            "support": discord.Color.from_rgb(96, 125, 139),  # Blue grey for support
-            "admin": discord.Color.red(),
-            "livealerts": discord.Color.purple(),  # Purple for live alerts (Twitch)
-            "autonews": discord.Color.from_rgb(255, 69, 0),  # Reddit orange
-            "owner": discord.Color.dark_red()
-        }
-        return colors.get(category, discord.Color.blurple())
+        return CATEGORY_COLORS.get(category, DEFAULT_CATEGORY_COLOR)
 
     def _build_credits_embed(self) -> discord.Embed:
         """Build the credits embed (Last Page)"""
@@ -2182,8 +2192,8 @@ class InformationView(View):
             color=discord.Color.purple()
         )
 
-        if self.bot.user:
-            embed.set_thumbnail(url=self.bot.user.display_avatar.url)
+        if self.thumbnail_url:
+            embed.set_thumbnail(url=self.thumbnail_url)
 
         # Developer
         embed.add_field(
@@ -2229,29 +2239,25 @@ class InformationView(View):
             inline=False
         )
 
-        embed.set_footer(text=f"Requested by {self.user} • {config.BOT_NAME} v{config.BOT_VERSION}")
+        embed.set_footer(text=f"Requested by {self.user_name} • {config.BOT_NAME} v{config.BOT_VERSION}")
 
         return embed
 
-    def update_buttons(self):
-        """Update the dropdown menu with all available pages"""
-        self.clear_items()
-
+    def _build_page_select(self) -> discord.ui.Select:
+        """Build the page dropdown once (only the selected page changes later)"""
         # Build dropdown options
         options = [
             discord.SelectOption(
                 label="About",
                 description="Introduction and bot info",
                 value="1",
-                emoji="📖",
-                default=(self.current_page == 1)
+                emoji="📖"
             ),
             discord.SelectOption(
                 label="Features",
                 description="Overview of bot features",
                 value="2",
-                emoji="✨",
-                default=(self.current_page == 2)
+                emoji="✨"
             )
         ]
 
@@ -2263,8 +2269,7 @@ class InformationView(View):
                     label=group["name"],
                     description=f"{len([c for c in group['categories'] if c in self.accessible_commands])} categories",
                     value=str(page_num),
-                    emoji=group["emoji"],
-                    default=(self.current_page == page_num)
+                    emoji=group["emoji"]
                 )
             )
 
@@ -2274,19 +2279,24 @@ class InformationView(View):
                 label="Credits",
                 description="Credits and acknowledgments",
                 value=str(self.total_pages),
-                emoji="💝",
-                default=(self.current_page == self.total_pages)
+                emoji="💝"
             )
         )
 
         # Create the select menu
         select = discord.ui.Select(
-            placeholder=f"Page {self.current_page}/{self.total_pages} - Select a page...",
             options=options,
             custom_id="page_select"
         )
         select.callback = self.on_page_select
-        self.add_item(select)
+        return select
+
+    def update_buttons(self):
+        """Mark the current page in the dropdown"""
+        current = str(self.current_page)
+        for option in self.page_select.options:
+            option.default = (option.value == current)
+        self.page_select.placeholder = f"Page {self.current_page}/{self.total_pages} - Select a page..."
 
     async def on_page_select(self, interaction: discord.Interaction):
         """Handle page selection from dropdown"""
@@ -2296,9 +2306,8 @@ class InformationView(View):
         await interaction.response.edit_message(embed=self.get_page_embed(), view=self)
 
     async def on_timeout(self):
-        """Disable all buttons when the view times out"""
-        for item in self.children:
-            item.disabled = True
+        """Disable the page dropdown when the view times out"""
+        self.page_select.disabled = True
 
 
 class Information(commands.Cog):
@@ -2314,17 +2323,20 @@ class Information(commands.Cog):
         Usage: /information
         Shows only commands the user has permission to use
         """
+        guild = interaction.guild
+        user = interaction.user
+
         # Log that someone used this command
-        guild_name = interaction.guild.name if interaction.guild else None
+        guild_name = guild.name if guild else None
         log_command(
-            user=str(interaction.user),
-            user_id=interaction.user.id,
+            user=str(user),
+            user_id=user.id,
             command="information",
             guild=guild_name
         )
 
         # Check if in a server (needed for permission checking)
-        if not interaction.guild:
+        if not guild:
             await interaction.response.send_message(
                 "This command works best in a server! Some features may be limited in DMs.",
                 ephemeral=True
@@ -2333,15 +2345,13 @@ class Information(commands.Cog):
 
         try:
             # Create the paginated view
-            view = InformationView(self.bot, interaction.user)
+            view = InformationView(self.bot, user)
             view.update_buttons()
 
             # Send the first page
             embed = view.get_page_embed()
             await interaction.response.send_message(embed=embed, view=view)
 
-            logger.info(f"Information command used by {interaction.user}")
-
         except Exception as e:
             logger.error(f"Failed to show information: {e}")
             await interaction.response.send_message(
@@ -9,6 +9,7 @@ NOTE: This is a GLOBAL economy - balances are shared across all servers!
 
 import json
 import os
+import time
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Tuple
 from utils.logger import logger
@@ -23,6 +24,10 @@ DAILY_BASE_AMOUNT = 100  # Base daily claim amount
 DAILY_STREAK_BONUS = 10  # Extra coins per day of streak
 MAX_STREAK_BONUS = 500   # Maximum bonus from streak (50 days)
 
+# Short-lived balance cache so repeat get_balance calls skip the file read
+BALANCE_CACHE_TTL = 2  # seconds
+_balance_cache: Dict[str, Tuple[float, int]] = {}
+
 
 def _ensure_data_dir():
     """Ensure the data directory exists"""
@@ -77,6 +82,7 @@ def _migrate_to_global(old_data: dict) -> dict:
 
     # Save the migrated data
     _save_economy_data(new_data)
+    _balance_cache.clear()
     logger.info(f"Migration complete! Migrated {len(new_data['users'])} users to global economy.")
     return new_data
 
@@ -117,6 +123,7 @@ def _update_user_data(user_id: int, user_data: dict):
     user_str = str(user_id)
     data["users"][user_str] = user_data
     _save_economy_data(data)
+    _balance_cache.pop(user_str, None)
 
 
 # =============================================================================
@@ -125,7 +132,14 @@ def _update_user_data(user_id: int, user_data: dict):
 
 def get_balance(guild_id: int, user_id: int) -> int:
     """Get a user's coin balance (GLOBAL - guild_id ignored)"""
+    user_str = str(user_id)
+    now = time.monotonic()
+    cached = _balance_cache.get(user_str)
+    if cached and cached[0] > now:
+        return cached[1]
+
     user_data = _get_user_data(user_id)
+    _balance_cache[user_str] = (now + BALANCE_CACHE_TTL, user_data["balance"])
     return user_data["balance"]
 
 
@@ -251,6 +265,38 @@ def record_gamble(guild_id: int, user_id: int, bet_amount: int, won: bool, win_a
     _update_user_data(user_id, user_data)
 
 
+def settle_gamble(guild_id: int, user_id: int, bet_amount: int, won: bool,
+                  payout: int = 0, source: str = "unknown") -> int:
+    """
+    Pay out (if won) and record a gamble in a single save. (GLOBAL - guild_id ignored)
+    The bet must already have been taken with remove_coins.
+    Returns the new balance.
+    """
+    user_data = _get_user_data(user_id)
+    user_data["total_gambled"] += bet_amount
+
+    if won:
+        user_data["balance"] += payout
+        user_data["total_earned"] += payout
+        user_data["total_won"] += payout - bet_amount
+    else:
+        user_data["total_lost"] += bet_amount
+
+    _update_user_data(user_id, user_data)
+
+    if won:
+        logger.info(f"Added {payout} coins to user {user_id} (source: {source})")
+
+        # Track peak_balance achievement
+        try:
+            update_achievement_stat(user_id, "peak_balance", value=user_data["balance"])
+            check_and_complete_achievements(user_id)
+        except:
+            pass
+
+    return user_data["balance"]
+
+
 def get_user_stats(guild_id: int, user_id: int) -> dict:
     """Get a user's full statistics (GLOBAL - guild_id ignored)"""
     return _get_user_data(user_id)
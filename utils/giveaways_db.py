@@ -10,6 +10,7 @@ Schema for Giveaways:
 - winners_count: Number of winners to pick
 - host_id: User who created the giveaway
 - ends_at: Timestamp when giveaway ends
+- ends_at_epoch: Same end time as Unix epoch seconds (for fast comparisons)
 - entries: List of user IDs who entered
 - ended: Whether giveaway has ended
 - winner_ids: List of winner user IDs (after ending)
@@ -23,6 +24,7 @@ Schema for Polls:
 - options: List of {label, emoji, votes: [user_ids]}
 - host_id: User who created the poll
 - ends_at: Optional end timestamp
+- ends_at_epoch: Same end time as Unix epoch seconds (if timed)
 - ended: Whether poll has ended
 - multiple_votes: Whether users can vote multiple options
 """
@@ -30,7 +32,8 @@ Schema for Polls:
 import os
 import json
 import random
-from datetime import datetime
+import bisect
+from datetime import datetime, timezone
 from typing import Optional, Dict, List
 
 # File path for storing giveaways data
@@ -38,25 +41,170 @@ DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
 GIVEAWAYS_FILE = os.path.join(DATA_DIR, 'giveaways.json')
 
 
+# Use orjson for faster (de)serialization when it's installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(data: dict) -> bytes:
+    """Serialize data to compact JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    # Compact one-shot dumps uses the C JSON encoder; indented output falls back to
+    # the pure-Python one and puts every entry ID on its own line
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def _loads(raw: bytes) -> dict:
+    """Parse JSON bytes (orjson's decode error subclasses json.JSONDecodeError)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# In-memory copy of the data file (write-through: updated on every save)
+# so button clicks don't re-read and re-parse the whole file
+_data_cache: Optional[dict] = None
+
+
 def _load_data() -> dict:
-    """Load giveaways/polls data from JSON file"""
+    """Load giveaways/polls data from the in-memory cache or JSON file"""
+    global _data_cache
+    if _data_cache is not None:
+        return _data_cache
+
     os.makedirs(DATA_DIR, exist_ok=True)
 
+    data = {"guilds": {}}
     if os.path.exists(GIVEAWAYS_FILE):
         try:
-            with open(GIVEAWAYS_FILE, 'r') as f:
-                return json.load(f)
+            with open(GIVEAWAYS_FILE, 'rb') as f:
+                data = _loads(f.read())
         except (json.JSONDecodeError, FileNotFoundError):
             pass
 
-    return {"guilds": {}}
+    _data_cache = data
+    return data
 
 
 def _save_data(data: dict):
-    """Save giveaways/polls data to JSON file"""
+    """Save giveaways/polls data to JSON file and the in-memory cache"""
+    global _data_cache
+    _data_cache = data
+
+    serialized = _dumps(data)
+
     os.makedirs(DATA_DIR, exist_ok=True)
-    with open(GIVEAWAYS_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    with open(GIVEAWAYS_FILE, 'wb') as f:
+        f.write(serialized)
+
+
+# User ID sets mirroring each entry/vote list, for O(1) membership checks
+# Keyed by ("giveaway", message_id) or ("poll", message_id, option_index)
+_member_sets: Dict[tuple, set] = {}
+
+
+def _member_set(key: tuple, user_ids: list) -> set:
+    """Get (or build) the membership set mirroring a list of user IDs"""
+    members = _member_sets.get(key)
+    if members is None:
+        members = _member_sets[key] = set(user_ids)
+    return members
+
+
+def _forget_members(message_id: int):
+    """Drop the membership sets of a deleted giveaway/poll"""
+    for key in [k for k in _member_sets if k[1] == message_id]:
+        del _member_sets[key]
+
+
+# Deadlines of active timed giveaways/polls, sorted by end time, so due checks
+# only look at the front of the list: (ends_at_epoch, message_id, guild_id, item)
+_deadlines: Dict[str, List[tuple]] = {}
+
+
+def _get_deadlines(kind: str) -> List[tuple]:
+    """Get the sorted deadline list for "giveaways" or "polls", building it on first use"""
+    deadlines = _deadlines.get(kind)
+    if deadlines is None:
+        data = _load_data()
+        deadlines = []
+        for guild_str, guild_data in data["guilds"].items():
+            for item in guild_data[kind]:
+                ends_at = None if item["ended"] else get_ends_at_epoch(item)
+                if ends_at is not None:
+                    deadlines.append((ends_at, item["message_id"], int(guild_str), item))
+        deadlines.sort()
+        _deadlines[kind] = deadlines
+    return deadlines
+
+
+def _add_deadline(kind: str, guild_id: int, item: dict):
+    """Track a newly created timed giveaway/poll"""
+    deadlines = _deadlines.get(kind)
+    if deadlines is not None and item.get("ends_at_epoch") is not None:
+        bisect.insort(deadlines, (item["ends_at_epoch"], item["message_id"], guild_id, item))
+
+
+def _drop_deadline(kind: str, message_id: int):
+    """Stop tracking a deleted giveaway/poll"""
+    deadlines = _deadlines.get(kind)
+    if deadlines is not None:
+        deadlines[:] = [d for d in deadlines if d[1] != message_id]
+
+
+def _get_due(kind: str, now_epoch: float) -> List[tuple[int, Dict]]:
+    """Get active items whose deadline has passed, pruning ended ones on the way"""
+    deadlines = _get_deadlines(kind)
+    due = []
+
+    i = 0
+    while i < len(deadlines) and deadlines[i][0] <= now_epoch:
+        item = deadlines[i][3]
+        if item["ended"]:
+            del deadlines[i]
+            continue
+        due.append((deadlines[i][2], item))
+        i += 1
+
+    return due
+
+
+def _next_deadline(kind: str) -> Optional[float]:
+    """Get the earliest deadline of an active item, pruning ended ones at the front"""
+    deadlines = _get_deadlines(kind)
+    while deadlines and deadlines[0][3]["ended"]:
+        deadlines.pop(0)
+    return deadlines[0][0] if deadlines else None
+
+
+def _to_epoch(iso: str) -> float:
+    """Convert a stored (UTC) ISO timestamp to Unix epoch seconds"""
+    return datetime.fromisoformat(iso).replace(tzinfo=timezone.utc).timestamp()
+
+
+def get_ends_at_epoch(item: dict) -> Optional[float]:
+    """Get an item's end time as epoch seconds, filling it in for older records"""
+    if "ends_at_epoch" not in item:
+        item["ends_at_epoch"] = _to_epoch(item["ends_at"]) if item.get("ends_at") else None
+    return item["ends_at_epoch"]
+
+
+def _reservoir_sample(user_ids, k: int) -> List[int]:
+    """Pick up to k random user IDs from an iterable in one pass, without building a full list"""
+    sample = []
+    for i, user_id in enumerate(user_ids):
+        if i < k:
+            sample.append(user_id)
+        else:
+            j = random.randrange(i + 1)
+            if j < k:
+                sample[j] = user_id
+    random.shuffle(sample)
+    return sample
 
 
 def _ensure_guild(data: dict, guild_id: int) -> dict:
@@ -106,6 +254,7 @@ def create_giveaway(
         "winners_count": winners_count,
         "host_id": host_id,
         "ends_at": ends_at,
+        "ends_at_epoch": _to_epoch(ends_at),
         "created_at": datetime.utcnow().isoformat(),
         "entries": [],
         "ended": False,
@@ -114,6 +263,7 @@ def create_giveaway(
     }
 
     guild_data["giveaways"].append(giveaway)
+    _add_deadline("giveaways", guild_id, giveaway)
     _save_data(data)
     return True, giveaway_id, "Giveaway created successfully!"
 
@@ -128,15 +278,19 @@ def enter_giveaway(guild_id: int, message_id: int, user_id: int) -> tuple[bool,
 
     for giveaway in data["guilds"][guild_str]["giveaways"]:
         if giveaway["message_id"] == message_id:
+            entries = giveaway["entries"]
+            members = _member_set(("giveaway", message_id), entries)
+
             if giveaway["ended"]:
                 return False, "This giveaway has ended!"
 
-            if user_id in giveaway["entries"]:
+            if user_id in members:
                 return False, "You're already entered!"
 
-            giveaway["entries"].append(user_id)
+            entries.append(user_id)
+            members.add(user_id)
             _save_data(data)
-            return True, f"You're entered! ({len(giveaway['entries'])} total entries)"
+            return True, f"You're entered! ({len(entries)} total entries)"
 
     return False, "Giveaway not found."
 
@@ -151,8 +305,12 @@ def leave_giveaway(guild_id: int, message_id: int, user_id: int) -> tuple[bool,
 
     for giveaway in data["guilds"][guild_str]["giveaways"]:
         if giveaway["message_id"] == message_id:
-            if user_id in giveaway["entries"]:
-                giveaway["entries"].remove(user_id)
+            entries = giveaway["entries"]
+            members = _member_set(("giveaway", message_id), entries)
+
+            if user_id in members:
+                entries.remove(user_id)
+                members.discard(user_id)
                 _save_data(data)
                 return True, "You've left the giveaway."
             return False, "You weren't entered."
@@ -160,6 +318,11 @@ def leave_giveaway(guild_id: int, message_id: int, user_id: int) -> tuple[bool,
     return False, "Giveaway not found."
 
 
+def has_entered(giveaway: Dict, user_id: int) -> bool:
+    """Check if a user has entered a giveaway"""
+    return user_id in _member_set(("giveaway", giveaway["message_id"]), giveaway["entries"])
+
+
 def end_giveaway(guild_id: int, message_id: int) -> tuple[bool, List[int], str]:
     """
     End a giveaway and pick winners
@@ -213,14 +376,14 @@ def reroll_giveaway(guild_id: int, message_id: int, count: int = 1) -> tuple[boo
 
             entries = giveaway["entries"]
             # Exclude previous winners if possible
-            available = [e for e in entries if e not in giveaway["winner_ids"]]
-            if not available:
-                available = entries
+            previous_winners = set(giveaway["winner_ids"])
+            new_winners = _reservoir_sample((e for e in entries if e not in previous_winners), count)
+            if not new_winners:
+                new_winners = random.sample(entries, min(count, len(entries)))
 
-            if not available:
+            if not new_winners:
                 return False, [], "No entries to reroll from!"
 
-            new_winners = random.sample(available, min(count, len(available)))
             giveaway["winner_ids"].extend(new_winners)
             _save_data(data)
 
@@ -255,6 +418,30 @@ def get_active_giveaways(guild_id: int) -> List[Dict]:
     return [g for g in data["guilds"][guild_str]["giveaways"] if not g["ended"]]
 
 
+def get_all_active_giveaways() -> List[Dict]:
+    """Get all active (not ended) giveaways across every guild"""
+    data = _load_data()
+    return [
+        g for guild_data in data["guilds"].values()
+        for g in guild_data["giveaways"] if not g["ended"]
+    ]
+
+
+def get_due_giveaways(now_epoch: float) -> List[tuple[int, Dict]]:
+    """
+    Get all active giveaways across every guild that should have ended by now
+
+    Returns:
+        List of (guild_id, giveaway)
+    """
+    return _get_due("giveaways", now_epoch)
+
+
+def skip_giveaway_deadline(message_id: int):
+    """Stop checking a due giveaway that can't be ended (e.g. the bot left its server)"""
+    _drop_deadline("giveaways", message_id)
+
+
 def get_all_giveaways(guild_id: int) -> List[Dict]:
     """Get all giveaways for a guild"""
     data = _load_data()
@@ -278,6 +465,8 @@ def delete_giveaway(guild_id: int, message_id: int) -> tuple[bool, str]:
     for i, giveaway in enumerate(giveaways):
         if giveaway["message_id"] == message_id:
             giveaways.pop(i)
+            _forget_members(message_id)
+            _drop_deadline("giveaways", message_id)
             _save_data(data)
             return True, "Giveaway deleted!"
 
@@ -331,11 +520,13 @@ def create_poll(
         "host_id": host_id,
         "created_at": datetime.utcnow().isoformat(),
         "ends_at": ends_at,
+        "ends_at_epoch": _to_epoch(ends_at) if ends_at else None,
         "ended": False,
         "multiple_votes": multiple_votes
     }
 
     guild_data["polls"].append(poll)
+    _add_deadline("polls", guild_id, poll)
     _save_data(data)
     return True, poll_id, "Poll created successfully!"
 
@@ -358,17 +549,22 @@ def vote_poll(guild_id: int, message_id: int, user_id: int, option_index: int) -
 
             # Check if user already voted
             if not poll["multiple_votes"]:
-                for opt in poll["options"]:
-                    if user_id in opt["votes"]:
+                for i, opt in enumerate(poll["options"]):
+                    voters = _member_set(("poll", message_id, i), opt["votes"])
+                    if user_id in voters:
                         # Remove old vote
                         opt["votes"].remove(user_id)
+                        voters.discard(user_id)
                         break
 
             # Add vote to selected option
-            if user_id in poll["options"][option_index]["votes"]:
+            option = poll["options"][option_index]
+            voters = _member_set(("poll", message_id, option_index), option["votes"])
+            if user_id in voters:
                 return False, "You already voted for this option!"
 
-            poll["options"][option_index]["votes"].append(user_id)
+            option["votes"].append(user_id)
+            voters.add(user_id)
             _save_data(data)
             return True, f"Vote cast for: {poll['options'][option_index]['label']}"
 
@@ -391,8 +587,11 @@ def unvote_poll(guild_id: int, message_id: int, user_id: int, option_index: int)
             if option_index < 0 or option_index >= len(poll["options"]):
                 return False, "Invalid option."
 
-            if user_id in poll["options"][option_index]["votes"]:
-                poll["options"][option_index]["votes"].remove(user_id)
+            option = poll["options"][option_index]
+            voters = _member_set(("poll", message_id, option_index), option["votes"])
+            if user_id in voters:
+                option["votes"].remove(user_id)
+                voters.discard(user_id)
                 _save_data(data)
                 return True, "Vote removed."
 
@@ -444,6 +643,36 @@ def get_active_polls(guild_id: int) -> List[Dict]:
     return [p for p in data["guilds"][guild_str]["polls"] if not p["ended"]]
 
 
+def get_all_active_polls() -> List[Dict]:
+    """Get all active polls across every guild"""
+    data = _load_data()
+    return [
+        p for guild_data in data["guilds"].values()
+        for p in guild_data["polls"] if not p["ended"]
+    ]
+
+
+def get_due_polls(now_epoch: float) -> List[tuple[int, Dict]]:
+    """
+    Get all active timed polls across every guild that should have ended by now
+
+    Returns:
+        List of (guild_id, poll)
+    """
+    return _get_due("polls", now_epoch)
+
+
+def skip_poll_deadline(message_id: int):
+    """Stop checking a due poll that can't be ended (e.g. the bot left its server)"""
+    _drop_deadline("polls", message_id)
+
+
+def get_next_ending_at() -> Optional[float]:
+    """Get the earliest end time (epoch seconds) of any active giveaway or timed poll"""
+    ends = [t for t in (_next_deadline("giveaways"), _next_deadline("polls")) if t is not None]
+    return min(ends) if ends else None
+
+
 def delete_poll(guild_id: int, message_id: int) -> tuple[bool, str]:
     """Delete a poll"""
     data = _load_data()
@@ -456,6 +685,8 @@ def delete_poll(guild_id: int, message_id: int) -> tuple[bool, str]:
     for i, poll in enumerate(polls):
         if poll["message_id"] == message_id:
             polls.pop(i)
+            _forget_members(message_id)
+            _drop_deadline("polls", message_id)
             _save_data(data)
             return True, "Poll deleted!"
 
@@ -3,6 +3,7 @@ Logging Utility for Gojo Discord Bot
 Sets up logging to both console and file
 """
 
+import asyncio
 import logging
 import os
 from datetime import datetime
@@ -90,6 +91,22 @@ def log_command(user: str, user_id: int, command: str, guild: str = None):
         pass
 
 
+def log_command_soon(user: str, user_id: int, command: str, guild: str = None):
+    """
+    Schedule log_command to run on the next event loop iteration.
+
+    Lets a command send its response first; the log line and achievement
+    stat update then run while the response request is in flight.
+    Falls back to logging immediately when no event loop is running.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        log_command(user, user_id, command, guild)
+        return
+    loop.call_soon(log_command, user, user_id, command, guild)
+
+
 def log_error(error: Exception, context: str = None):
     """
     Log an error with optional context.
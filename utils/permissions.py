@@ -0,0 +1,12 @@
+"""
+Permission Helpers
+Raw Discord permission bits, so commands can check permissions
+with bitmasks instead of attribute lookups
+"""
+
+from typing import Dict
+
+import discord
+
+# Raw permission bit for every named Discord permission (e.g. "manage_messages")
+PERMISSION_MASKS: Dict[str, int] = dict(discord.Permissions.VALID_FLAGS)